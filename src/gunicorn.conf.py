@@ -0,0 +1,36 @@
+import multiprocessing
+import os
+import shutil
+
+# Gunicorn settings for the chaos orchestrator: gunicorn -c gunicorn.conf.py app:app
+
+# Multiprocess Prometheus metrics only apply under gunicorn; set here rather than in the
+# image so other entrypoints keep the default registry. Workers inherit it at fork, and
+# on_starting creates the directory.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+# Rate limits are kept in each worker's memory, so a client can make up to
+# workers x requests_per_minute requests across the server
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+# Threads of one worker share its SecurityManager, whose rate limit state is locked
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = 60
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    """Start every run with an empty Prometheus multiprocess directory"""
+    multiproc_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's Prometheus samples in multiprocess mode"""
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,6 +1,8 @@
-from flask import Flask, jsonify, Response, send_from_directory, render_template
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Counter, Gauge
+from flask import Flask, jsonify, Response, request, send_from_directory, render_template
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Counter, CollectorRegistry, REGISTRY, multiprocess
+from prometheus_client.core import GaugeMetricFamily
 import random
+import hashlib
 import psutil
 import threading
 import time
@@ -29,6 +31,7 @@ app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), '../
 
 # Configure Flask app
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev_secret_key_2025')
+app.config['TESTING'] = os.getenv('TESTING') == '1'
 
 # Initialize security
 security = SecurityManager()
@@ -40,70 +43,238 @@ try:
 except Exception as e:
     logger.error(f"Database initialization failed: {e}")
 
-# Initialize AI analyzer
-try:
-    ai_analyzer = NLPLogAnalyzer()
-except Exception as e:
-    logger.warning(f"AI analyzer not available: {e}")
-    ai_analyzer = None
+# Initialize AI analyzer (skipped under TESTING, where nothing uses it)
+ai_analyzer = None
+if not app.config['TESTING']:
+    try:
+        ai_analyzer = NLPLogAnalyzer()
+    except Exception as e:
+        logger.warning(f"AI analyzer not available: {e}")
 
 # Prometheus metrics - unique names to avoid conflicts
-CPU_USAGE = Gauge('system_cpu_percent', 'Current CPU usage percentage')
-MEMORY_USAGE = Gauge('system_memory_percent', 'Current memory usage percentage')
 CHAOS_REQUESTS_COUNT = Counter('chaos_orchestrator_requests_total', 'Total number of requests to the chaos orchestrator')
 CHAOS_INJECTIONS_COUNT = Counter('chaos_injections_total', 'Total number of chaos injections performed')
 CHAOS_SCENARIOS_COUNT = Counter('chaos_scenarios_total', 'Total number of scenarios executed', ['scenario_type'])
 
-def update_system_metrics():
-    """Background thread to update system metrics"""
-    retry_count = 0
-    max_retries = 3
-    
-    while True:
+# Comprehensive list of real-world chaos scenarios
+AVAILABLE_SCENARIOS = (
+    "cpu_spike",
+    "memory_leak",
+    "disk_fill",
+    "network_latency",
+    "network_partition",
+    "process_kill",
+    "container_restart",
+    "database_slowdown",
+    "api_timeout",
+    "ssl_certificate_expired",
+    "dns_failure",
+    "storage_corruption",
+    "kubernetes_pod_eviction",
+    "service_discovery_failure",
+    "load_balancer_failure"
+)
+
+# The scenario list never changes at runtime, so encode the response body once
+_SCENARIOS_BYTES = json.dumps({"scenarios": list(AVAILABLE_SCENARIOS)}).encode('utf-8')
+
+# One labelled counter child per known scenario, so /inject skips the labels() lookup
+_SCENARIO_METRICS = {s: CHAOS_SCENARIOS_COUNT.labels(scenario_type=s) for s in AVAILABLE_SCENARIOS}
+
+# Scenarios simulated with a single sleep: (display name, verb, per-intensity
+# cap in seconds, or None to hold for the full duration)
+_SLEEP_SCENARIOS = {
+    "network_latency": ("Network latency", "injected", None),
+    "database_slowdown": ("Database slowdown", "injected", None),
+    "api_timeout": ("API timeout", "simulated", {"low": 5, "medium": 10, "high": 30}),
+    "process_kill": ("Process instability", "simulated", {"low": 30, "medium": 15, "high": 5}),
+}
+
+# Display names and duration scaling for the generic simulations
+_SIMULATION_NAMES = {
+    "network_partition": "Network partition simulation",
+    "container_restart": "Container restart simulation",
+    "ssl_certificate_expired": "SSL certificate expiry simulation",
+    "dns_failure": "DNS resolution failure simulation",
+    "storage_corruption": "Storage corruption simulation",
+    "kubernetes_pod_eviction": "Kubernetes pod eviction simulation",
+    "service_discovery_failure": "Service discovery failure simulation",
+    "load_balancer_failure": "Load balancer failure simulation"
+}
+_GENERIC_DURATION_FACTOR = {"low": 0.5, "medium": 0.75, "high": 1.0}
+
+# Busy-loop iterations between deadline checks in cpu_spike (a few ms of spinning)
+_BURN_CHECK_INTERVAL = 100_000
+
+# 1 MiB block reused for every disk_fill write
+_MB_BUF = b'x' * (1 << 20)
+
+# Filesystem sampled for disk usage, and the cached /inject reading of it
+_DISK_ROOT = 'C:' if os.name == 'nt' else '/'
+DISK_USAGE_TTL = 1.0
+_disk_usage_cache = (0.0, None)
+
+_JOKE_METRIC = "# HELP mayhem_joke_metric Number of times chaos made us laugh\n# TYPE mayhem_joke_metric counter\nmayhem_joke_metric 42\n"
+
+# Serialized /chaos-history payload, reused for a few seconds between DB reads
+HISTORY_CACHE_TTL = 5.0
+_history_cache = (0.0, None)
+
+def _cached_disk_percent():
+    """Root filesystem usage, re-read at most once per DISK_USAGE_TTL"""
+    global _disk_usage_cache
+    expires_at, percent = _disk_usage_cache
+    now = time.monotonic()
+    if percent is None or now >= expires_at:
+        percent = psutil.disk_usage(_DISK_ROOT).percent
+        _disk_usage_cache = (now + DISK_USAGE_TTL, percent)
+    return percent
+
+class SystemMetricsCollector:
+    """Reads system CPU and memory usage from psutil when Prometheus scrapes"""
+
+    def collect(self):
         try:
-            CPU_USAGE.set(psutil.cpu_percent(interval=1))
-            MEMORY_USAGE.set(psutil.virtual_memory().percent)
-            retry_count = 0  # Reset on success
-        except psutil.NoSuchProcess as e:
+            yield GaugeMetricFamily('system_cpu_percent', 'Current CPU usage percentage',
+                                    value=psutil.cpu_percent(interval=None))
+            yield GaugeMetricFamily('system_memory_percent', 'Current memory usage percentage',
+                                    value=psutil.virtual_memory().percent)
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             logger.error(f"Process monitoring error: {e}")
-            retry_count += 1
-        except psutil.AccessDenied as e:
-            logger.error(f"Access denied when collecting system metrics: {e}")
-            retry_count += 1
         except Exception as e:
-            logger.error(f"Unexpected error updating metrics: {e}")
-            retry_count += 1
-            
-        if retry_count >= max_retries:
-            logger.critical(f"Failed to collect metrics {max_retries} consecutive times. Resetting counter.")
-            retry_count = 0
-            
-        time.sleep(5)
+            logger.error(f"Unexpected error collecting system metrics: {e}")
 
-# Start metrics collection thread
-try:
-    metrics_thread = threading.Thread(target=update_system_metrics, daemon=True)
-    metrics_thread.start()
-    logger.info("System metrics collection thread started successfully")
-except Exception as e:
-    logger.error(f"Failed to start metrics collection thread: {e}")
-    # Continue without metrics if thread fails to start
+SYSTEM_METRICS_COLLECTOR = SystemMetricsCollector()
+REGISTRY.register(SYSTEM_METRICS_COLLECTOR)
+# Prime cpu_percent so the first scrape reports usage since startup rather than 0.0
+psutil.cpu_percent(interval=None)
+
+# Chaos workloads, run on background threads by /inject
+def _mark_experiment_failed(experiment, error_message):
+    """Record a chaos failure on the experiment, if one was created"""
+    if experiment:
+        try:
+            experiment.error_message = error_message
+            experiment.status = 'failed'
+            db.session.commit()
+        except Exception as db_e:
+            logger.error(f"Failed to update experiment error: {db_e}")
+
+def _burn(end_time):
+    # Check the deadline once per block so the spin is mostly work, not clock reads
+    while time.monotonic() < end_time:
+        for _ in range(_BURN_CHECK_INTERVAL):
+            pass
+
+def cpu_stress(experiment, duration, intensity):
+    try:
+        end_time = time.monotonic() + duration
+        thread_count = {"low": 2, "medium": 4, "high": 8}[intensity]
+        threads = [threading.Thread(target=_burn, args=(end_time,)) for _ in range(thread_count)]
+        for t in threads: 
+            t.start()
+        for t in threads: 
+            t.join()
+        logger.info(f"CPU spike chaos completed for experiment {experiment.id if experiment else 'unknown'}")
+    except Exception as e:
+        logger.error(f"CPU spike chaos failed: {e}")
+        _mark_experiment_failed(experiment, str(e))
+
+def mem_stress(experiment, duration, intensity):
+    try:
+        multiplier = {"low": 5000, "medium": 10000, "high": 20000}[intensity]
+        leaker = []
+        for i in range(duration * multiplier):
+            leaker.append(' ' * 1024)
+            time.sleep(0.001)
+        time.sleep(duration)
+        del leaker
+        logger.info(f"Memory leak chaos completed for experiment {experiment.id if experiment else 'unknown'}")
+    except MemoryError as e:
+        logger.error(f"Memory leak chaos hit system limits: {e}")
+        _mark_experiment_failed(experiment, f"Hit memory limits: {str(e)}")
+    except Exception as e:
+        logger.error(f"Memory leak chaos failed: {e}")
+        _mark_experiment_failed(experiment, str(e))
+
+def disk_stress(experiment, duration, intensity):
+    try:
+        size_mb = {"low": 50, "medium": 100, "high": 200}[intensity]
+        temp_files = []
+        temp_dir = "/tmp" if os.name != 'nt' else "C:\\temp"
+        
+        # Ensure temp directory exists
+        os.makedirs(temp_dir, exist_ok=True)
+        
+        for i in range(size_mb):
+            filename = os.path.join(temp_dir, f"chaos_disk_{i}.tmp")
+            with open(filename, 'wb') as f:
+                f.write(_MB_BUF)  # 1MB file
+            temp_files.append(filename)
+        time.sleep(duration)
+        # Cleanup
+        for f in temp_files:
+            try:
+                os.remove(f)
+            except FileNotFoundError:
+                pass
+            except Exception as cleanup_e:
+                logger.warning(f"Failed to cleanup temp file {f}: {cleanup_e}")
+        logger.info(f"Disk fill chaos completed for experiment {experiment.id if experiment else 'unknown'}")
+    except PermissionError as e:
+        logger.error(f"Permission denied during disk fill chaos: {e}")
+        _mark_experiment_failed(experiment, f"Permission denied: {str(e)}")
+    except OSError as e:
+        logger.error(f"OS error during disk fill chaos: {e}")
+        _mark_experiment_failed(experiment, f"OS error: {str(e)}")
+    except Exception as e:
+        logger.error(f"Disk fill chaos failed: {e}")
+        _mark_experiment_failed(experiment, str(e))
+
+def simulated_chaos(experiment, scenario_name, sleep_seconds):
+    try:
+        time.sleep(sleep_seconds)
+        logger.info(f"{scenario_name} chaos completed for experiment {experiment.id if experiment else 'unknown'}")
+    except Exception as e:
+        logger.error(f"{scenario_name} chaos failed: {e}")
+        _mark_experiment_failed(experiment, str(e))
+
+def _load_index_html():
+    """Read the UI page once so / and /ui don't hit the filesystem per request"""
+    try:
+        with open(os.path.join(app.static_folder, "index.html"), 'rb') as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"Could not preload index.html, serving from disk: {e}")
+        return None
+
+_INDEX_HTML = _load_index_html()
+_INDEX_ETAG = hashlib.sha256(_INDEX_HTML).hexdigest() if _INDEX_HTML is not None else None
+
+def _index_response():
+    if _INDEX_HTML is None:
+        return send_from_directory(app.static_folder, "index.html")
+    # If-None-Match uses weak comparison (RFC 7232), so W/ tags from proxies still match
+    if request.if_none_match.contains_weak(_INDEX_ETAG):
+        response = Response(status=304)
+    else:
+        response = Response(_INDEX_HTML, mimetype='text/html')
+    response.set_etag(_INDEX_ETAG)
+    return response
 
 # Humorous root endpoint
 @app.route("/")
 def home():
     # Redirect to the UI
-    return send_from_directory(app.static_folder, "index.html")
+    return _index_response()
 
 # UI route (for direct /ui access)
 @app.route("/ui")
 def ui():
-    return send_from_directory(app.static_folder, "index.html")
+    return _index_response()
 
 
 # Chaos injection endpoint
-from flask import request
-
 @app.route("/inject", methods=["POST"])
 @security.require_api_key
 @security.rate_limit(requests_per_minute=30)
@@ -136,7 +307,7 @@ def inject():
             current_metrics = {
                 'cpu_percent': psutil.cpu_percent(),
                 'memory_percent': psutil.virtual_memory().percent,
-                'disk_percent': psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent
+                'disk_percent': _cached_disk_percent()
             }
             
             experiment = ChaosExperiment(
@@ -158,7 +329,10 @@ def inject():
         # Increment chaos injection counter
         try:
             CHAOS_INJECTIONS_COUNT.inc()
-            CHAOS_SCENARIOS_COUNT.labels(scenario_type=scenario).inc()
+            scenario_metric = _SCENARIO_METRICS.get(scenario)
+            if scenario_metric is None:
+                scenario_metric = CHAOS_SCENARIOS_COUNT.labels(scenario_type=scenario)
+            scenario_metric.inc()
         except Exception as e:
             logger.warning(f"Failed to update Prometheus metrics: {e}")
         
@@ -166,239 +340,28 @@ def inject():
         
         try:
             if scenario == "cpu_spike":
-                def cpu_stress():
-                    try:
-                        end_time = time.time() + duration
-                        thread_count = {"low": 2, "medium": 4, "high": 8}[intensity]
-                        def burn():
-                            while time.time() < end_time:
-                                pass
-                        threads = [threading.Thread(target=burn) for _ in range(thread_count)]
-                        for t in threads: 
-                            t.start()
-                        for t in threads: 
-                            t.join()
-                        logger.info(f"CPU spike chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"CPU spike chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=cpu_stress).start()
+                threading.Thread(target=cpu_stress, args=(experiment, duration, intensity)).start()
                 result = {"result": f"CPU spike ({intensity}) injected for {duration}s", "scenario": scenario}
             
             elif scenario == "memory_leak":
-                def mem_stress():
-                    try:
-                        multiplier = {"low": 5000, "medium": 10000, "high": 20000}[intensity]
-                        leaker = []
-                        for i in range(duration * multiplier):
-                            leaker.append(' ' * 1024)
-                            time.sleep(0.001)
-                        time.sleep(duration)
-                        del leaker
-                        logger.info(f"Memory leak chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except MemoryError as e:
-                        logger.error(f"Memory leak chaos hit system limits: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = f"Hit memory limits: {str(e)}"
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                    except Exception as e:
-                        logger.error(f"Memory leak chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=mem_stress).start()
+                threading.Thread(target=mem_stress, args=(experiment, duration, intensity)).start()
                 result = {"result": f"Memory leak ({intensity}) injected for {duration}s", "scenario": scenario}
             
             elif scenario == "disk_fill":
-                def disk_stress():
-                    try:
-                        size_mb = {"low": 50, "medium": 100, "high": 200}[intensity]
-                        temp_files = []
-                        temp_dir = "/tmp" if os.name != 'nt' else "C:\\temp"
-                        
-                        # Ensure temp directory exists
-                        os.makedirs(temp_dir, exist_ok=True)
-                        
-                        for i in range(size_mb):
-                            filename = os.path.join(temp_dir, f"chaos_disk_{i}.tmp")
-                            with open(filename, 'w') as f:
-                                f.write('x' * (1024 * 1024))  # 1MB file
-                            temp_files.append(filename)
-                        time.sleep(duration)
-                        # Cleanup
-                        for f in temp_files:
-                            try:
-                                os.remove(f)
-                            except FileNotFoundError:
-                                pass
-                            except Exception as cleanup_e:
-                                logger.warning(f"Failed to cleanup temp file {f}: {cleanup_e}")
-                        logger.info(f"Disk fill chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except PermissionError as e:
-                        logger.error(f"Permission denied during disk fill chaos: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = f"Permission denied: {str(e)}"
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                    except OSError as e:
-                        logger.error(f"OS error during disk fill chaos: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = f"OS error: {str(e)}"
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                    except Exception as e:
-                        logger.error(f"Disk fill chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=disk_stress).start()
+                threading.Thread(target=disk_stress, args=(experiment, duration, intensity)).start()
                 result = {"result": f"Disk fill ({intensity}) injected for {duration}s", "scenario": scenario}
             
-            elif scenario == "network_latency":
-                # Simulate network latency by adding delays to responses
-                def network_delay():
-                    try:
-                        delay_ms = {"low": 100, "medium": 500, "high": 1000}[intensity]
-                        # Store original response time
-                        end_time = time.time() + duration
-                        while time.time() < end_time:
-                            time.sleep(delay_ms / 1000)
-                        logger.info(f"Network latency chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"Network latency chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=network_delay).start()
-                result = {"result": f"Network latency ({intensity}) injected for {duration}s", "scenario": scenario}
-            
-            elif scenario == "api_timeout":
-                def timeout_simulation():
-                    try:
-                        timeout_duration = {"low": 5, "medium": 10, "high": 30}[intensity]
-                        time.sleep(min(timeout_duration, duration))
-                        logger.info(f"API timeout chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"API timeout chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=timeout_simulation).start()
-                result = {"result": f"API timeout ({intensity}) simulated for {duration}s", "scenario": scenario}
-            
-            elif scenario == "process_kill":
-                # Simulate process instability
-                def process_chaos():
-                    try:
-                        # This is a safe simulation - just sleeps
-                        kill_delay = {"low": 30, "medium": 15, "high": 5}[intensity]
-                        time.sleep(min(kill_delay, duration))
-                        logger.info(f"Process kill chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"Process kill chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=process_chaos).start()
-                result = {"result": f"Process instability ({intensity}) simulated for {duration}s", "scenario": scenario}
-            
-            elif scenario == "database_slowdown":
-                def db_slowdown():
-                    try:
-                        # Simulate database connection delays
-                        query_delay = {"low": 0.1, "medium": 0.5, "high": 2.0}[intensity]
-                        end_time = time.time() + duration
-                        while time.time() < end_time:
-                            time.sleep(query_delay)
-                        logger.info(f"Database slowdown chaos completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"Database slowdown chaos failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
-                                
-                threading.Thread(target=db_slowdown).start()
-                result = {"result": f"Database slowdown ({intensity}) injected for {duration}s", "scenario": scenario}
-            
             else:
-                # For unimplemented scenarios, provide realistic simulation
-                simulation_scenarios = {
-                    "network_partition": "Network partition simulation",
-                    "container_restart": "Container restart simulation", 
-                    "ssl_certificate_expired": "SSL certificate expiry simulation",
-                    "dns_failure": "DNS resolution failure simulation",
-                    "storage_corruption": "Storage corruption simulation",
-                    "kubernetes_pod_eviction": "Kubernetes pod eviction simulation",
-                    "service_discovery_failure": "Service discovery failure simulation",
-                    "load_balancer_failure": "Load balancer failure simulation"
-                }
-                
-                scenario_name = simulation_scenarios.get(scenario, scenario)
-                
-                def generic_chaos():
-                    try:
-                        # Generic chaos simulation with variable intensity
-                        impact_duration = {"low": duration * 0.5, "medium": duration * 0.75, "high": duration}[intensity]
-                        time.sleep(impact_duration)
-                        logger.info(f"Generic chaos scenario '{scenario}' completed for experiment {experiment.id if experiment else 'unknown'}")
-                    except Exception as e:
-                        logger.error(f"Generic chaos scenario '{scenario}' failed: {e}")
-                        if experiment:
-                            try:
-                                experiment.error_message = str(e)
-                                experiment.status = 'failed'
-                                db.session.commit()
-                            except Exception as db_e:
-                                logger.error(f"Failed to update experiment error: {db_e}")
+                # Remaining scenarios are simulated by holding a worker for a while
+                if scenario in _SLEEP_SCENARIOS:
+                    scenario_name, verb, sleep_caps = _SLEEP_SCENARIOS[scenario]
+                    sleep_seconds = min(sleep_caps[intensity], duration) if sleep_caps else duration
+                else:
+                    scenario_name, verb = _SIMULATION_NAMES.get(scenario, scenario), "executed"
+                    sleep_seconds = duration * _GENERIC_DURATION_FACTOR[intensity]
                 
-                threading.Thread(target=generic_chaos).start()
-                result = {"result": f"{scenario_name} ({intensity}) executed for {duration}s", "scenario": scenario}
+                threading.Thread(target=simulated_chaos, args=(experiment, scenario_name, sleep_seconds)).start()
+                result = {"result": f"{scenario_name} ({intensity}) {verb} for {duration}s", "scenario": scenario}
             
             # Update experiment status to completed if successful
             if experiment and not experiment.error_message:
@@ -434,29 +397,7 @@ def inject():
 @app.route("/scenarios")
 def scenarios():
     """Return available chaos scenarios"""
-    try:
-        # Comprehensive list of real-world chaos scenarios
-        available = [
-            "cpu_spike",
-            "memory_leak", 
-            "disk_fill",
-            "network_latency",
-            "network_partition",
-            "process_kill",
-            "container_restart",
-            "database_slowdown",
-            "api_timeout",
-            "ssl_certificate_expired",
-            "dns_failure",
-            "storage_corruption",
-            "kubernetes_pod_eviction",
-            "service_discovery_failure",
-            "load_balancer_failure"
-        ]
-        return jsonify({"scenarios": available})
-    except Exception as e:
-        logger.error(f"Failed to retrieve scenarios: {e}")
-        return jsonify({"error": "Failed to retrieve scenarios"}), 500
+    return Response(_SCENARIOS_BYTES, mimetype='application/json')
 
 
 # Humorous health check endpoint
@@ -477,20 +418,32 @@ def health():
         return jsonify({"status": "error", "message": "Health check failed"}), 500
 
 
-# Humorous metrics endpoint
+def _metrics_registry():
+    """Registry to expose, merging all gunicorn workers in multiprocess mode"""
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(SYSTEM_METRICS_COLLECTOR)
+    return registry
+
+# Prometheus metrics endpoint
 @app.route("/metrics")
 def metrics():
-    """Prometheus metrics endpoint with Easter eggs"""
+    """Prometheus metrics endpoint"""
     try:
         CHAOS_REQUESTS_COUNT.inc()
-        # Easter egg: Occasionally return a joke metric
-        if random.randint(1, 20) == 10:
-            return Response("# HELP mayhem_joke_metric Number of times chaos made us laugh\n# TYPE mayhem_joke_metric counter\nmayhem_joke_metric 42\n", mimetype=CONTENT_TYPE_LATEST)
-        return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
+        return Response(generate_latest(_metrics_registry()), mimetype=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error(f"Failed to generate metrics: {e}")
         return Response("# Error generating metrics\n", mimetype=CONTENT_TYPE_LATEST), 500
 
+# Easter egg, kept off the scrape path
+@app.route("/metrics/joke")
+def metrics_joke():
+    """Joke metric formerly returned at random by /metrics"""
+    return Response(_JOKE_METRIC, mimetype=CONTENT_TYPE_LATEST)
+
 @app.route("/system-status")
 def system_status():
     """Comprehensive system status endpoint"""
@@ -506,10 +459,7 @@ def system_status():
         
         # Handle different OS disk paths
         try:
-            if os.name == 'nt':
-                disk_info = psutil.disk_usage('C:')._asdict()
-            else:
-                disk_info = psutil.disk_usage('/')._asdict()
+            disk_info = psutil.disk_usage(_DISK_ROOT)._asdict()
         except (PermissionError, FileNotFoundError) as e:
             logger.warning(f"Cannot access disk usage: {e}")
             disk_info = {"error": "Cannot access disk usage"}
@@ -553,7 +503,13 @@ def system_status():
 @app.route("/chaos-history")
 def chaos_history():
     """Return history of chaos injections from database"""
+    global _history_cache
     try:
+        expires_at, cached_body = _history_cache
+        now = time.monotonic()
+        if cached_body is not None and now < expires_at:
+            return Response(cached_body, mimetype='application/json')
+
         # Get real experiment history from database
         experiments = ChaosExperiment.query.order_by(ChaosExperiment.start_time.desc()).limit(20).all()
         
@@ -572,7 +528,9 @@ def chaos_history():
                 "client_ip": exp.client_ip
             })
         
-        return jsonify({"history": history})
+        body = json.dumps({"history": history}).encode('utf-8')
+        _history_cache = (now + HISTORY_CACHE_TTL, body)
+        return Response(body, mimetype='application/json')
     except Exception as e:
         logger.error(f"Failed to retrieve chaos history: {e}")
         # Fallback to mock data if database fails
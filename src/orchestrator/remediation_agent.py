@@ -1,26 +1,173 @@
+import atexit
 import logging
+import queue
 import time
-from typing import Dict, Any, Optional, List, Union
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, NamedTuple, Optional, List, Tuple, Union
 from datetime import datetime
 
+def _configure_async_logging() -> Optional[QueueListener]:
+    """Send root logging through a queue so remediation calls never block on stderr writes"""
+    root = logging.getLogger()
+    if root.handlers:
+        # Logging already configured by the host application
+        return None
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_log_listener = _configure_async_logging()
 logger = logging.getLogger(__name__)
 
+# Lookup tables shared by every RemediationAgent; built once, read-only
+# (event-type keys are lowercase)
+_SUPPORTED_EVENTS = frozenset({
+    'cpu_spike', 'memory_leak', 'network_partition', 'disk_full',
+    'process_crash', 'database_error', 'api_timeout'
+})
+
+_INTENSITY_MULTIPLIER = MappingProxyType({
+    "low": 0.5,
+    "medium": 1.0,
+    "high": 1.5,
+    "critical": 2.0
+})
+
+# Duration above 300s / 600s scales the score; score at or above each threshold
+# moves up one severity label
+_DURATION_THRESHOLDS = (300, 600)
+_DURATION_MULTIPLIERS = (1.0, 1.5, 2.0)
+_SEVERITY_THRESHOLDS = (1.0, 1.5, 2.0)
+_SEVERITY_LABELS = ("low", "medium", "high", "critical")
+
+# Severity label per intensity, indexed by duration bucket; precomputed from the
+# multipliers above so the hot path is two lookups and no arithmetic
+_SEVERITY_TABLE = MappingProxyType({
+    intensity: tuple(
+        _SEVERITY_LABELS[bisect_right(_SEVERITY_THRESHOLDS, multiplier * duration_multiplier)]
+        for duration_multiplier in _DURATION_MULTIPLIERS
+    )
+    for intensity, multiplier in _INTENSITY_MULTIPLIER.items()
+})
+_DEFAULT_SEVERITY_ROW = _SEVERITY_TABLE["medium"]  # Unknown intensity scores as 1.0
+
+# Event fields whose presence raises assessment confidence
+_CONFIDENCE_FIELDS = ("intensity", "duration", "description")
+
+# Confidence by data completeness (0..len(_CONFIDENCE_FIELDS)) for unknown / known event types:
+# 70% / 80% base plus up to 20% for populated fields
+_CONFIDENCE_TABLE = tuple(
+    tuple(min(base + (completeness / len(_CONFIDENCE_FIELDS)) * 0.2, 1.0)
+          for completeness in range(len(_CONFIDENCE_FIELDS) + 1))
+    for base in (0.7, 0.8)
+)
+
+_SERVICE_MAPPING = MappingProxyType({
+    "cpu_spike": ("api-server", "worker-processes", "background-jobs"),
+    "memory_leak": ("application-services", "cache-layer", "database"),
+    "network_partition": ("all-services", "load-balancer", "service-mesh"),
+    "disk_full": ("logging-service", "database", "file-storage"),
+    "database_error": ("api-server", "data-layer", "reporting"),
+    "api_timeout": ("frontend", "gateway", "external-integrations")
+})
+_UNKNOWN_SERVICES = ("unknown-service",)
+
+_RECOMMENDATIONS = MappingProxyType({
+    "cpu_spike": (
+        "Scale out application instances",
+        "Optimize CPU-intensive processes",
+        "Implement CPU throttling"
+    ),
+    "memory_leak": (
+        "Restart affected services",
+        "Implement memory monitoring",
+        "Review application code for memory leaks"
+    ),
+    "network_partition": (
+        "Check network connectivity",
+        "Verify load balancer configuration",
+        "Implement circuit breaker pattern"
+    )
+})
+_GENERIC_RECOMMENDATIONS = (
+    "Monitor system metrics",
+    "Review application logs",
+    "Implement health checks"
+)
+_ESCALATION_SEVERITIES = frozenset({"high", "critical"})
+_ESCALATION_RECOMMENDATIONS = (
+    "Consider triggering incident response",
+    "Notify on-call team"
+)
+
+# (epoch second, ISO string) of the last formatted timestamp; swapped as one tuple
+_ts_cache = (0, "")
+
+def _iso_now() -> str:
+    """UTC ISO timestamp at one-second resolution, formatted at most once per second"""
+    global _ts_cache
+    now = int(time.time())
+    cached_second, cached_iso = _ts_cache
+    if cached_second != now:
+        cached_iso = datetime.utcfromtimestamp(now).isoformat()
+        _ts_cache = (now, cached_iso)
+    return cached_iso
+
+@lru_cache(maxsize=64)
+def _recs_for(event_type_lower: str, severity: str) -> Tuple[str, ...]:
+    """Shared recommendation tuple for an (event type, severity) pair"""
+    recommendations = _RECOMMENDATIONS.get(event_type_lower, _GENERIC_RECOMMENDATIONS)
+    
+    # Add severity-specific recommendations
+    if severity in _ESCALATION_SEVERITIES:
+        recommendations += _ESCALATION_RECOMMENDATIONS
+    
+    return recommendations
+
+class RemediationRecord(NamedTuple):
+    """One remediation attempt kept in RemediationAgent.remediation_history"""
+    timestamp: str
+    strategy: str
+    event_type: str
+    success: bool
+    duration: float
+    error: Optional[str] = None
+
 class RemediationAgent:
     """Automated remediation agent with comprehensive error handling"""
     
+    __slots__ = ("current_state", "max_history", "remediation_history", "supported_events", "_dispatch")
+    
     def __init__(self):
         """Initialize the remediation agent"""
         self.current_state = "unknown"
-        self.remediation_history = []
         self.max_history = 100  # Limit history to prevent memory bloat
-        self.supported_events = {
-            'cpu_spike', 'memory_leak', 'network_partition', 'disk_full',
-            'process_crash', 'database_error', 'api_timeout'
+        self.remediation_history = deque(maxlen=self.max_history)
+        self.supported_events = _SUPPORTED_EVENTS
+        # Remediation handlers keyed by strategy name and by event type
+        self._dispatch = {
+            "remediate_network_failure": self._remediate_network_issues,
+            "network_partition": self._remediate_network_issues,
+            "remediate_cpu_spike": self._remediate_cpu_issues,
+            "cpu_spike": self._remediate_cpu_issues,
+            "remediate_memory_leak": self._remediate_memory_issues,
+            "memory_leak": self._remediate_memory_issues,
+            "remediate_disk_full": self._remediate_disk_issues,
+            "disk_full": self._remediate_disk_issues,
         }
         logger.info("RemediationAgent initialized")
     
@@ -46,59 +193,81 @@ class RemediationAgent:
             
             # Handle string input
             if isinstance(chaos_event, str):
-                chaos_event = {"event": chaos_event, "description": chaos_event}
+                return self._assess_from_str(chaos_event)
             
             # Validate dict input
             if not isinstance(chaos_event, dict):
-                logger.error(f"Invalid chaos_event type: {type(chaos_event)}")
+                logger.error("Invalid chaos_event type: %s", type(chaos_event))
                 return {
                     "severity": "unknown",
                     "affected_services": [],
                     "error": "Invalid event data type"
                 }
             
-            # Extract event information
-            event_type = chaos_event.get("event", chaos_event.get("type", "unknown"))
-            event_description = chaos_event.get("description", str(chaos_event))
-            event_intensity = chaos_event.get("intensity", "medium")
-            event_duration = chaos_event.get("duration", 0)
-            
-            # Assess severity based on event type and characteristics
-            try:
-                severity = self._calculate_severity(event_type, event_intensity, event_duration)
-                affected_services = self._identify_affected_services(event_type, chaos_event)
-                confidence = self._calculate_confidence(event_type, chaos_event)
-                
-                assessment = {
-                    "severity": severity,
-                    "affected_services": affected_services,
-                    "event_type": event_type,
-                    "confidence": confidence,
-                    "assessment_time": datetime.utcnow().isoformat(),
-                    "recommendations": self._generate_recommendations(event_type, severity)
-                }
-                
-                logger.info(f"Impact assessment completed: {severity} severity for {event_type}")
-                return assessment
-                
-            except Exception as e:
-                logger.error(f"Error calculating impact assessment: {e}")
-                return {
-                    "severity": "medium",  # Default to medium severity
-                    "affected_services": ["unknown"],
-                    "event_type": event_type,
-                    "confidence": 0.3,
-                    "error": f"Assessment calculation failed: {str(e)}"
-                }
+            return self._assess_from_dict(chaos_event)
             
         except Exception as e:
-            logger.error(f"Critical error in impact assessment: {e}")
+            logger.exception("Critical error in impact assessment")
             return {
                 "severity": "unknown",
                 "affected_services": [],
                 "error": f"Critical assessment failure: {str(e)}"
             }
     
+    def _assess_from_dict(self, chaos_event: Dict[str, Any]) -> Dict[str, Any]:
+        """Assess an already-validated event dict"""
+        # Extract event information
+        event_type = chaos_event.get("event", chaos_event.get("type", "unknown"))
+        event_description = chaos_event.get("description", str(chaos_event))
+        event_intensity = chaos_event.get("intensity", "medium")
+        event_duration = chaos_event.get("duration", 0)
+        event_type_lower = str(event_type).lower()
+        
+        # Assess severity based on event type and characteristics
+        try:
+            severity = self._calculate_severity(event_type_lower, event_intensity, event_duration)
+            affected_services = self._identify_affected_services(event_type_lower, chaos_event)
+            confidence = self._calculate_confidence(event_type_lower, chaos_event)
+            
+            assessment = {
+                "severity": severity,
+                "affected_services": affected_services,
+                "event_type": event_type,
+                "confidence": confidence,
+                "assessment_time": _iso_now(),
+                "recommendations": self._generate_recommendations(event_type_lower, severity)
+            }
+            
+            logger.info("Impact assessment completed: %s severity for %s", severity, event_type)
+            return assessment
+        
+        except Exception as e:
+            logger.exception("Error calculating impact assessment")
+            return {
+                "severity": "medium",  # Default to medium severity
+                "affected_services": ["unknown"],
+                "event_type": event_type,
+                "confidence": 0.3,
+                "error": f"Assessment calculation failed: {str(e)}"
+            }
+    
+    def _assess_from_str(self, event_type: str) -> Dict[str, Any]:
+        """Assess a bare event name: medium intensity, no duration, the name as description"""
+        event_type_lower = event_type.lower()
+        severity = self._calculate_severity(event_type_lower, "medium", 0)
+        
+        assessment = {
+            "severity": severity,
+            "affected_services": list(_SERVICE_MAPPING.get(event_type_lower, _UNKNOWN_SERVICES)),
+            "event_type": event_type,
+            "confidence": self._confidence_score(event_type_lower, 1 if event_type else 0),
+            "assessment_time": _iso_now(),
+            "recommendations": self._generate_recommendations(event_type_lower, severity)
+        }
+        
+        logger.info("Impact assessment completed: %s severity for %s", severity, event_type)
+        return assessment
+    
     def execute_remediation(self, assessment_result: Optional[Union[str, Dict[str, Any]]] = None) -> bool:
         """
         Apply remediation strategies based on the assessment result.
@@ -121,187 +290,123 @@ class RemediationAgent:
             
             # Validate dict input
             if not isinstance(assessment_result, dict):
-                logger.error(f"Invalid assessment_result type: {type(assessment_result)}")
+                logger.error("Invalid assessment_result type: %s", type(assessment_result))
                 return False
             
             # Extract remediation strategy
             strategy = assessment_result.get("strategy", "default")
-            severity = assessment_result.get("severity", "medium")
             event_type = assessment_result.get("event_type", "unknown")
+            return self._remediate(strategy, event_type, assessment_result)
             
-            remediation_start = time.time()
-            success = False
-            
-            try:
-                # Execute appropriate remediation strategy
-                if strategy == "remediate_network_failure" or event_type == "network_partition":
-                    success = self._remediate_network_issues(assessment_result)
-                elif strategy == "remediate_cpu_spike" or event_type == "cpu_spike":
-                    success = self._remediate_cpu_issues(assessment_result)
-                elif strategy == "remediate_memory_leak" or event_type == "memory_leak":
-                    success = self._remediate_memory_issues(assessment_result)
-                elif strategy == "remediate_disk_full" or event_type == "disk_full":
-                    success = self._remediate_disk_issues(assessment_result)
-                else:
-                    success = self._generic_remediation(assessment_result)
-                
-                # Update system state based on remediation success
-                if success:
-                    self.current_state = "healthy"
-                    logger.info(f"Remediation successful for {event_type}")
-                else:
-                    self.current_state = "degraded"
-                    logger.warning(f"Remediation failed for {event_type}")
-                
-                # Record remediation attempt
-                remediation_duration = time.time() - remediation_start
-                self._record_remediation(strategy, event_type, success, remediation_duration)
-                
-                return success
-                
-            except Exception as e:
-                logger.error(f"Error executing remediation strategy {strategy}: {e}")
-                self.current_state = "error"
-                self._record_remediation(strategy, event_type, False, time.time() - remediation_start, str(e))
-                return False
-            
-        except Exception as e:
-            logger.error(f"Critical error in remediation execution: {e}")
+        except Exception:
+            logger.exception("Critical error in remediation execution")
             self.current_state = "error"
             return False
     
-    def _calculate_severity(self, event_type: str, intensity: str, duration: int) -> str:
-        """Calculate severity based on event characteristics"""
+    def handle_event(self, chaos_event: Optional[Union[Dict[str, Any], str]] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Assess a chaos event and remediate it in one pass.
+        
+        Equivalent to execute_remediation(assess_impact(chaos_event)), but the
+        event is validated and its type extracted only once.
+        
+        Parameters:
+        chaos_event (dict or str): Information about the chaos event.
+        
+        Returns:
+        tuple: (assessment dict, True if remediation was successful)
+        """
         try:
-            base_severity = {
-                "cpu_spike": "medium",
-                "memory_leak": "high",
-                "network_partition": "high",
-                "disk_full": "high",
-                "process_crash": "medium",
-                "database_error": "high",
-                "api_timeout": "medium"
-            }.get(event_type.lower(), "medium")
-            
-            # Adjust based on intensity
-            intensity_multiplier = {
-                "low": 0.5,
-                "medium": 1.0,
-                "high": 1.5,
-                "critical": 2.0
-            }.get(intensity.lower(), 1.0)
-            
-            # Adjust based on duration
-            duration_multiplier = 1.0
-            if duration > 300:  # 5 minutes
-                duration_multiplier = 1.5
-            elif duration > 600:  # 10 minutes
-                duration_multiplier = 2.0
+            if isinstance(chaos_event, str):
+                assessment = self._assess_from_str(chaos_event)
+            elif isinstance(chaos_event, dict):
+                assessment = self._assess_from_dict(chaos_event)
+            else:
+                # None or an unsupported type; nothing to remediate
+                return self.assess_impact(chaos_event), False
             
-            severity_score = intensity_multiplier * duration_multiplier
+            success = self._remediate("default", assessment["event_type"], assessment)
+            return assessment, success
             
-            if severity_score >= 2.0:
-                return "critical"
-            elif severity_score >= 1.5:
-                return "high"
-            elif severity_score >= 1.0:
-                return "medium"
-            else:
-                return "low"
-                
         except Exception as e:
-            logger.warning(f"Error calculating severity: {e}")
-            return "medium"
+            logger.exception("Critical error handling chaos event")
+            self.current_state = "error"
+            return {
+                "severity": "unknown",
+                "affected_services": [],
+                "error": f"Critical event handling failure: {str(e)}"
+            }, False
     
-    def _identify_affected_services(self, event_type: str, event_data: Dict[str, Any]) -> List[str]:
-        """Identify services potentially affected by the event"""
+    def _remediate(self, strategy: str, event_type: str, assessment_result: Dict[str, Any]) -> bool:
+        """Run the handler for strategy/event_type and record the attempt"""
+        remediation_start = time.perf_counter()
+        success = False
+        
         try:
-            # Extract explicit service list if provided
-            if "affected_services" in event_data:
-                services = event_data["affected_services"]
-                if isinstance(services, list):
-                    return services[:10]  # Limit to 10 services
+            # Execute appropriate remediation strategy, matched by strategy name first
+            handler = (self._dispatch.get(str(strategy))
+                       or self._dispatch.get(str(event_type))
+                       or self._generic_remediation)
+            success = handler(assessment_result)
             
-            # Predict affected services based on event type
-            service_mapping = {
-                "cpu_spike": ["api-server", "worker-processes", "background-jobs"],
-                "memory_leak": ["application-services", "cache-layer", "database"],
-                "network_partition": ["all-services", "load-balancer", "service-mesh"],
-                "disk_full": ["logging-service", "database", "file-storage"],
-                "database_error": ["api-server", "data-layer", "reporting"],
-                "api_timeout": ["frontend", "gateway", "external-integrations"]
-            }
+            # Update system state based on remediation success
+            if success:
+                self.current_state = "healthy"
+                logger.info("Remediation successful for %s", event_type)
+            else:
+                self.current_state = "degraded"
+                logger.warning("Remediation failed for %s", event_type)
             
-            return service_mapping.get(event_type.lower(), ["unknown-service"])
+            # Record remediation attempt
+            remediation_duration = time.perf_counter() - remediation_start
+            self._record_remediation(strategy, event_type, success, remediation_duration)
             
+            return success
+        
         except Exception as e:
-            logger.warning(f"Error identifying affected services: {e}")
-            return ["unknown-service"]
+            logger.exception("Error executing remediation strategy %s", strategy)
+            self.current_state = "error"
+            self._record_remediation(strategy, event_type, False, time.perf_counter() - remediation_start, str(e))
+            return False
+    
+    def _calculate_severity(self, event_type_lower: str, intensity: str, duration: int) -> str:
+        """Calculate severity based on event characteristics"""
+        # Row by intensity, column by duration (strictly over 5 / 10 minutes)
+        row = _SEVERITY_TABLE.get(str(intensity).lower(), _DEFAULT_SEVERITY_ROW)
+        
+        if not isinstance(duration, (int, float)):
+            duration = 0
+        return row[bisect_left(_DURATION_THRESHOLDS, duration)]
     
-    def _calculate_confidence(self, event_type: str, event_data: Dict[str, Any]) -> float:
+    def _identify_affected_services(self, event_type_lower: str, event_data: Dict[str, Any]) -> List[str]:
+        """Identify services potentially affected by the event"""
+        # Extract explicit service list if provided
+        services = event_data.get("affected_services")
+        if isinstance(services, list):
+            return services[:10]  # Limit to 10 services
+        
+        # Predict affected services based on event type
+        return list(_SERVICE_MAPPING.get(event_type_lower, _UNKNOWN_SERVICES))
+    
+    def _calculate_confidence(self, event_type_lower: str, event_data: Dict[str, Any]) -> float:
         """Calculate confidence level in the assessment"""
-        try:
-            base_confidence = 0.7  # 70% default confidence
-            
-            # Higher confidence for known event types
-            if event_type.lower() in self.supported_events:
-                base_confidence = 0.8
-            
-            # Adjust based on data completeness
-            data_completeness = 0
-            expected_fields = ["intensity", "duration", "description"]
-            for field in expected_fields:
-                if field in event_data and event_data[field]:
-                    data_completeness += 1
-            
-            completeness_bonus = (data_completeness / len(expected_fields)) * 0.2
-            
-            return min(base_confidence + completeness_bonus, 1.0)
-            
-        except Exception as e:
-            logger.warning(f"Error calculating confidence: {e}")
-            return 0.5
+        # Adjust based on data completeness
+        data_completeness = 0
+        for field in _CONFIDENCE_FIELDS:
+            if event_data.get(field):
+                data_completeness += 1
+        
+        return self._confidence_score(event_type_lower, data_completeness)
     
-    def _generate_recommendations(self, event_type: str, severity: str) -> List[str]:
+    def _confidence_score(self, event_type_lower: str, data_completeness: int) -> float:
+        """Confidence from event-type familiarity and how many detail fields were populated"""
+        # Higher confidence for known event types
+        return _CONFIDENCE_TABLE[event_type_lower in self.supported_events][data_completeness]
+    
+    def _generate_recommendations(self, event_type_lower: str, severity: str) -> List[str]:
         """Generate remediation recommendations"""
-        try:
-            recommendations = []
-            
-            if event_type == "cpu_spike":
-                recommendations = [
-                    "Scale out application instances",
-                    "Optimize CPU-intensive processes",
-                    "Implement CPU throttling"
-                ]
-            elif event_type == "memory_leak":
-                recommendations = [
-                    "Restart affected services",
-                    "Implement memory monitoring",
-                    "Review application code for memory leaks"
-                ]
-            elif event_type == "network_partition":
-                recommendations = [
-                    "Check network connectivity",
-                    "Verify load balancer configuration",
-                    "Implement circuit breaker pattern"
-                ]
-            else:
-                recommendations = [
-                    "Monitor system metrics",
-                    "Review application logs",
-                    "Implement health checks"
-                ]
-            
-            # Add severity-specific recommendations
-            if severity in ["high", "critical"]:
-                recommendations.append("Consider triggering incident response")
-                recommendations.append("Notify on-call team")
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.warning(f"Error generating recommendations: {e}")
-            return ["Review system status manually"]
+        # Callers get their own list; the cached tuple stays shared
+        return list(_recs_for(event_type_lower, str(severity)))
     
     def _remediate_network_issues(self, assessment: Dict[str, Any]) -> bool:
         """Remediate network-related issues"""
@@ -310,8 +415,8 @@ class RemediationAgent:
             # Simulate network remediation steps
             time.sleep(0.1)  # Simulate work
             return True
-        except Exception as e:
-            logger.error(f"Network remediation failed: {e}")
+        except Exception:
+            logger.exception("Network remediation failed")
             return False
     
     def _remediate_cpu_issues(self, assessment: Dict[str, Any]) -> bool:
@@ -321,8 +426,8 @@ class RemediationAgent:
             # Simulate CPU remediation steps
             time.sleep(0.1)  # Simulate work
             return True
-        except Exception as e:
-            logger.error(f"CPU remediation failed: {e}")
+        except Exception:
+            logger.exception("CPU remediation failed")
             return False
     
     def _remediate_memory_issues(self, assessment: Dict[str, Any]) -> bool:
@@ -332,8 +437,8 @@ class RemediationAgent:
             # Simulate memory remediation steps
             time.sleep(0.1)  # Simulate work
             return True
-        except Exception as e:
-            logger.error(f"Memory remediation failed: {e}")
+        except Exception:
+            logger.exception("Memory remediation failed")
             return False
     
     def _remediate_disk_issues(self, assessment: Dict[str, Any]) -> bool:
@@ -343,8 +448,8 @@ class RemediationAgent:
             # Simulate disk remediation steps
             time.sleep(0.1)  # Simulate work
             return True
-        except Exception as e:
-            logger.error(f"Disk remediation failed: {e}")
+        except Exception:
+            logger.exception("Disk remediation failed")
             return False
     
     def _generic_remediation(self, assessment: Dict[str, Any]) -> bool:
@@ -354,31 +459,21 @@ class RemediationAgent:
             # Simulate generic remediation steps
             time.sleep(0.1)  # Simulate work
             return True
-        except Exception as e:
-            logger.error(f"Generic remediation failed: {e}")
+        except Exception:
+            logger.exception("Generic remediation failed")
             return False
     
     def _record_remediation(self, strategy: str, event_type: str, success: bool, 
                           duration: float, error: Optional[str] = None):
         """Record remediation attempt in history"""
         try:
-            record = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "strategy": strategy,
-                "event_type": event_type,
-                "success": success,
-                "duration": duration,
-                "error": error
-            }
+            record = RemediationRecord(_iso_now(), strategy, event_type, success, duration, error)
             
+            # Bounded deque drops the oldest entry once max_history is reached
             self.remediation_history.append(record)
-            
-            # Limit history size
-            if len(self.remediation_history) > self.max_history:
-                self.remediation_history = self.remediation_history[-self.max_history:]
                 
         except Exception as e:
-            logger.warning(f"Failed to record remediation history: {e}")
+            logger.warning("Failed to record remediation history: %s", e)
     
     def get_remediation_status(self) -> Dict[str, Any]:
         """Get current remediation agent status"""
@@ -386,9 +481,11 @@ class RemediationAgent:
             return {
                 "current_state": self.current_state,
                 "history_count": len(self.remediation_history),
-                "recent_remediations": self.remediation_history[-5:] if self.remediation_history else [],
+                "recent_remediations": [
+                    record._asdict() for record in list(islice(reversed(self.remediation_history), 5))[::-1]
+                ],
                 "supported_events": list(self.supported_events)
             }
         except Exception as e:
-            logger.error(f"Error getting remediation status: {e}")
+            logger.exception("Error getting remediation status")
             return {"error": str(e)}
\ No newline at end of file
@@ -1,5 +1,10 @@
 import logging
-from typing import Dict, List, Any, Optional, Union
+import re
+import reprlib
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -8,19 +13,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Failure keyword scanner: one case-insensitive pass finds every keyword in the text.
+# The matching group number gives the cpu > memory > network priority (group N is
+# _FAILURE_TEMPLATES[N - 1]), so matched text never needs lowercasing.
+_FAILURE_KEYWORD_RE = re.compile(r"(cpu)|(memory)|(network)", re.IGNORECASE)
+# Canned scenarios, read-only; results hand out copies
+_FAILURE_TEMPLATES = (
+    MappingProxyType({"name": "CPU spike", "details": "Simulate high CPU usage based on past CPU failure"}),
+    MappingProxyType({"name": "Memory leak", "details": "Simulate memory leak based on past memory failure"}),
+    MappingProxyType({"name": "Network partition", "details": "Simulate network issues based on past network failure"}),
+)
+
+# Size-limited repr for dict failures without a text field, so a huge or deeply nested
+# entry never gets fully stringified
+_FAILURE_REPR = reprlib.Repr()
+_FAILURE_REPR.maxlevel = 3
+_FAILURE_REPR.maxdict = 10
+_FAILURE_REPR.maxlist = 10
+_FAILURE_REPR.maxstring = 100
+_FAILURE_REPR.maxother = 100
+_MAX_FAILURE_REPR = 200
+
+def _failure_text(failure: Dict[str, Any]) -> str:
+    """Text for a dict failure entry: description, else message, else a bounded repr"""
+    for field in ("description", "message"):
+        text = failure.get(field)
+        if isinstance(text, str):
+            return text
+    return _FAILURE_REPR.repr(failure)[:_MAX_FAILURE_REPR]
+
+def _classify_failure(failure_text: str) -> Optional[int]:
+    """Rank of the highest-priority failure keyword in the text, or None"""
+    best = None
+    for match in _FAILURE_KEYWORD_RE.finditer(failure_text):
+        rank = match.lastindex - 1
+        if rank == 0:
+            return rank
+        if best is None or rank < best:
+            best = rank
+    return best
+
+def _failure_kind(failure_text: str) -> Union[int, str]:
+    """Template rank for a failure text, else the truncated text of its generic scenario"""
+    rank = _classify_failure(failure_text)
+    return rank if rank is not None else failure_text[:100]  # Truncate long descriptions
+
+# Proactive scenario per system metric: (metrics key, threshold, name, details template).
+# Order matches the metric arguments of _scenarios_for.
+_METRIC_RULES = (
+    ("cpu", 85, "CPU stress", "Current CPU usage is high ({}%), stress test CPU"),
+    ("memory", 85, "Memory stress", "Current memory usage is high ({}%), stress test memory"),
+    ("disk", 90, "Disk full", "Disk usage is high ({}%), simulate disk full scenario"),
+)
+
+@lru_cache(maxsize=128, typed=True)
+def _scenarios_for(failure_kinds: Tuple[Union[int, str], ...], cpu_usage: Optional[float],
+                   memory_usage: Optional[float], disk_usage: Optional[float],
+                   max_scenarios: int) -> Tuple[Mapping[str, str], ...]:
+    """
+    Deduplicated scenarios for the given failure kinds and over-threshold metrics.
+    
+    Keyed on reduced inputs only: each failure is a template rank or its truncated
+    text, and each metric is None unless it exceeds its threshold. typed=True keeps
+    90 and 90.0 apart, since the value is echoed into the scenario details. The
+    cached dicts are shared, so callers must copy them before handing them out.
+    """
+    # Deduplicated as they are produced; the dict keeps the first scenario per key in
+    # insertion order, and generation stops once max_scenarios unique entries exist
+    unique_scenarios = {}
+    
+    for scenario in _candidate_scenarios(failure_kinds, (cpu_usage, memory_usage, disk_usage)):
+        scenario_key = (scenario['name'], scenario['details'])
+        if scenario_key in unique_scenarios:
+            continue
+        if len(unique_scenarios) >= max_scenarios:
+            logger.warning("Reached %s scenarios, skipping the remaining inputs", max_scenarios)
+            break
+        unique_scenarios[scenario_key] = scenario
+    
+    return tuple(unique_scenarios.values())
+
+def _candidate_scenarios(failure_kinds: Tuple[Union[int, str], ...],
+                         metric_values: Tuple[Optional[float], ...]) -> Iterator[Mapping[str, str]]:
+    """Yield scenarios for past failures, then proactive ones for high metrics"""
+    # Analyze past failures to create targeted scenarios
+    for kind in failure_kinds:
+        if isinstance(kind, int):
+            yield _FAILURE_TEMPLATES[kind]
+        else:
+            yield {"name": "Generic failure", "details": f"Simulate failure: {kind}"}
+    
+    # Use system metrics to add proactive scenarios
+    for (_, _, name, details), value in zip(_METRIC_RULES, metric_values):
+        if value is not None:
+            yield {"name": name, "details": details.format(value)}
+
+# Fallback scenarios, shared by every generator and read-only; callers get copies
+_DEFAULT_SCENARIOS = (
+    MappingProxyType({"name": "CPU spike", "details": "Basic CPU stress test"}),
+    MappingProxyType({"name": "Memory leak", "details": "Basic memory stress test"}),
+    MappingProxyType({"name": "Network latency", "details": "Basic network degradation test"})
+)
+
+# Details suffix appended by evolve_scenarios, keyed by feedback result
+_EVOLVE_SUFFIX = {
+    "success": " (increased severity)",  # Increase severity
+    "failure": " (try alternative failure mode)",  # Try a different type of chaos
+}
+
 class ScenarioGenerator:
     """Chaos scenario generator with comprehensive error handling"""
     
+    __slots__ = ("max_scenarios", "default_scenarios")
+    
     def __init__(self):
         """Initialize the scenario generator with default configurations"""
         self.max_scenarios = 50  # Prevent excessive scenario generation
-        self.default_scenarios = [
-            {"name": "CPU spike", "details": "Basic CPU stress test"},
-            {"name": "Memory leak", "details": "Basic memory stress test"},
-            {"name": "Network latency", "details": "Basic network degradation test"}
-        ]
+        self.default_scenarios = _DEFAULT_SCENARIOS
         logger.info("ScenarioGenerator initialized")
     
+    def _copy_defaults(self) -> List[Dict[str, str]]:
+        """Fresh copies of the default scenarios, safe for callers to modify"""
+        return [dict(scenario) for scenario in self.default_scenarios]
+    
     def generate_scenarios(self, past_failures: Optional[List[Union[str, Dict]]] = None, 
                          system_metrics: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
         """
@@ -31,8 +146,6 @@ class ScenarioGenerator:
         :return: List of generated chaos scenarios.
         """
         try:
-            scenarios = []
-            
             # Input validation
             if past_failures is None:
                 past_failures = []
@@ -44,117 +157,55 @@ class ScenarioGenerator:
             
             # Validate past_failures is a list
             if not isinstance(past_failures, list):
-                logger.warning(f"past_failures should be a list, got {type(past_failures)}")
+                logger.warning("past_failures should be a list, got %s", type(past_failures))
                 past_failures = []
             
             # Validate system_metrics is a dict
             if not isinstance(system_metrics, dict):
-                logger.warning(f"system_metrics should be a dict, got {type(system_metrics)}")
+                logger.warning("system_metrics should be a dict, got %s", type(system_metrics))
                 system_metrics = {}
             
-            # Analyze past failures to create targeted scenarios
-            try:
-                for failure in past_failures[:20]:  # Limit to first 20 failures to prevent excessive processing
-                    try:
-                        # Handle both string and dict failure entries
-                        failure_text = ""
-                        if isinstance(failure, str):
-                            failure_text = failure
-                        elif isinstance(failure, dict):
-                            failure_text = failure.get('description', failure.get('message', str(failure)))
-                        else:
-                            logger.debug(f"Skipping invalid failure entry: {failure}")
-                            continue
-                        
-                        failure_lower = failure_text.lower()
-                        
-                        if "cpu" in failure_lower:
-                            scenarios.append({
-                                "name": "CPU spike",
-                                "details": "Simulate high CPU usage based on past CPU failure"
-                            })
-                        elif "memory" in failure_lower:
-                            scenarios.append({
-                                "name": "Memory leak",
-                                "details": "Simulate memory leak based on past memory failure"
-                            })
-                        elif "network" in failure_lower:
-                            scenarios.append({
-                                "name": "Network partition",
-                                "details": "Simulate network issues based on past network failure"
-                            })
-                        else:
-                            scenarios.append({
-                                "name": "Generic failure",
-                                "details": f"Simulate failure: {failure_text[:100]}"  # Truncate long descriptions
-                            })
-                    except Exception as e:
-                        logger.warning(f"Error processing failure entry: {e}")
-                        continue
-                        
-            except Exception as e:
-                logger.error(f"Error processing past failures: {e}")
-            
-            # Use system metrics to add proactive scenarios
-            try:
-                cpu_usage = system_metrics.get("cpu", 0)
-                memory_usage = system_metrics.get("memory", 0)
-                disk_usage = system_metrics.get("disk", 0)
-                
-                # Validate metric values
-                if isinstance(cpu_usage, (int, float)) and cpu_usage > 85:
-                    scenarios.append({
-                        "name": "CPU stress",
-                        "details": f"Current CPU usage is high ({cpu_usage}%), stress test CPU"
-                    })
-                
-                if isinstance(memory_usage, (int, float)) and memory_usage > 85:
-                    scenarios.append({
-                        "name": "Memory stress",
-                        "details": f"Current memory usage is high ({memory_usage}%), stress test memory"
-                    })
+            # Reduce each supported failure entry to its hashable kind for the cache key;
+            # other entry types are skipped
+            failure_kinds = []
+            for failure in islice(past_failures, 20):  # Limit to first 20 failures to prevent excessive processing
+                # Handle both string and dict failure entries; exact-type checks first,
+                # isinstance only for subclasses
+                failure_type = type(failure)
+                if failure_type is str:
+                    failure_text = failure
+                elif failure_type is dict or isinstance(failure, dict):
+                    failure_text = _failure_text(failure)
+                elif isinstance(failure, str):
+                    failure_text = failure
+                else:
+                    logger.debug("Skipping invalid failure entry: %s", failure)
+                    continue
                 
-                if isinstance(disk_usage, (int, float)) and disk_usage > 90:
-                    scenarios.append({
-                        "name": "Disk full",
-                        "details": f"Disk usage is high ({disk_usage}%), simulate disk full scenario"
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error processing system metrics: {e}")
+                failure_kinds.append(_failure_kind(failure_text))
             
-            # Remove duplicates safely
-            try:
-                unique_scenarios = []
-                seen = set()
-                
-                for scenario in scenarios:
-                    if isinstance(scenario, dict) and 'name' in scenario:
-                        scenario_key = (scenario['name'], scenario.get('details', ''))
-                        if scenario_key not in seen:
-                            seen.add(scenario_key)
-                            unique_scenarios.append(scenario)
-                
-                # Ensure we don't exceed max scenarios
-                if len(unique_scenarios) > self.max_scenarios:
-                    logger.warning(f"Generated {len(unique_scenarios)} scenarios, truncating to {self.max_scenarios}")
-                    unique_scenarios = unique_scenarios[:self.max_scenarios]
-                
-                # If no scenarios were generated, use defaults
-                if not unique_scenarios:
-                    logger.info("No scenarios generated from inputs, using default scenarios")
-                    unique_scenarios = self.default_scenarios.copy()
-                
-                logger.info(f"Generated {len(unique_scenarios)} chaos scenarios")
-                return unique_scenarios
-                
-            except Exception as e:
-                logger.error(f"Error removing duplicates: {e}")
-                return self.default_scenarios.copy()
+            # Only numeric metric values above their threshold take part in the proactive checks
+            metric_values = []
+            for key, threshold, _, _ in _METRIC_RULES:
+                value = system_metrics.get(key, 0)
+                is_high = isinstance(value, (int, float)) and value > threshold
+                metric_values.append(value if is_high else None)
+            
+            # Copy the cached dicts so a caller editing its result can't corrupt the cache
+            cached = _scenarios_for(tuple(failure_kinds), *metric_values, self.max_scenarios)
+            unique_scenarios = [dict(scenario) for scenario in cached]
+            
+            # If no scenarios were generated, use defaults
+            if not unique_scenarios:
+                logger.info("No scenarios generated from inputs, using default scenarios")
+                unique_scenarios = self._copy_defaults()
+            
+            logger.info("Generated %s chaos scenarios", len(unique_scenarios))
+            return unique_scenarios
             
         except Exception as e:
-            logger.error(f"Critical error in scenario generation: {e}")
-            return self.default_scenarios.copy()
+            logger.error("Critical error in scenario generation: %s", e)
+            return self._copy_defaults()
 
     def evolve_scenarios(self, scenarios: Optional[List[Dict[str, str]]] = None, 
                         feedback: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
@@ -168,7 +219,7 @@ class ScenarioGenerator:
         try:
             # Input validation
             if scenarios is None:
-                scenarios = self.default_scenarios.copy()
+                scenarios = self._copy_defaults()
                 logger.debug("No scenarios provided, using defaults")
             
             if feedback is None:
@@ -176,82 +227,59 @@ class ScenarioGenerator:
                 logger.debug("No feedback provided, using empty dict")
             
             if not isinstance(scenarios, list):
-                logger.warning(f"scenarios should be a list, got {type(scenarios)}")
-                scenarios = self.default_scenarios.copy()
+                logger.warning("scenarios should be a list, got %s", type(scenarios))
+                scenarios = self._copy_defaults()
             
             if not isinstance(feedback, dict):
-                logger.warning(f"feedback should be a dict, got {type(feedback)}")
+                logger.warning("feedback should be a dict, got %s", type(feedback))
                 feedback = {}
             
             evolved_scenarios = []
+            feedback_result = feedback.get("result", "unknown")
+            suffix = _EVOLVE_SUFFIX.get(feedback_result) if isinstance(feedback_result, str) else None
             
-            try:
-                for scenario in scenarios[:self.max_scenarios]:  # Limit processing
-                    try:
-                        if not isinstance(scenario, dict):
-                            logger.debug(f"Skipping invalid scenario: {scenario}")
-                            continue
-                        
-                        # Ensure scenario has required fields
-                        if 'name' not in scenario:
-                            logger.debug(f"Scenario missing 'name' field: {scenario}")
-                            continue
-                        
-                        scenario_copy = scenario.copy()
-                        
-                        # If feedback indicates success, increase severity or add new failure mode
-                        feedback_result = feedback.get("result", "unknown")
-                        
-                        if feedback_result == "success":
-                            details = scenario_copy.get("details", "")
-                            scenario_copy["details"] = f"{details} (increased severity)"
-                            evolved_scenarios.append(scenario_copy)
-                        elif feedback_result == "failure":
-                            # If failure, try a different type of chaos
-                            details = scenario_copy.get("details", "")
-                            scenario_copy["details"] = f"{details} (try alternative failure mode)"
-                            evolved_scenarios.append(scenario_copy)
-                        else:
-                            evolved_scenarios.append(scenario_copy)
-                            
-                    except Exception as e:
-                        logger.warning(f"Error evolving scenario {scenario}: {e}")
-                        continue
-                        
-            except Exception as e:
-                logger.error(f"Error evolving scenarios: {e}")
-                evolved_scenarios = scenarios.copy() if scenarios else self.default_scenarios.copy()
+            for scenario in islice(scenarios, self.max_scenarios):  # Limit processing
+                if not isinstance(scenario, dict):
+                    logger.debug("Skipping invalid scenario: %s", scenario)
+                    continue
+                
+                # Ensure scenario has required fields
+                if 'name' not in scenario:
+                    logger.debug("Scenario missing 'name' field: %s", scenario)
+                    continue
+                
+                # Only scenarios whose details change get a new dict; the rest are shared
+                if suffix:
+                    evolved_scenarios.append({**scenario, "details": f"{scenario.get('details', '')}{suffix}"})
+                else:
+                    evolved_scenarios.append(scenario)
             
             # Optionally add a new scenario if feedback suggests
-            try:
-                if feedback.get("add_network_partition"):
-                    evolved_scenarios.append({
-                        "name": "Network partition",
-                        "details": "Simulate network issues as suggested by feedback"
-                    })
-                
-                if feedback.get("add_cpu_spike"):
-                    evolved_scenarios.append({
-                        "name": "CPU spike",
-                        "details": "Simulate CPU spike as suggested by feedback"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error adding feedback-suggested scenarios: {e}")
+            if feedback.get("add_network_partition"):
+                evolved_scenarios.append({
+                    "name": "Network partition",
+                    "details": "Simulate network issues as suggested by feedback"
+                })
+            
+            if feedback.get("add_cpu_spike"):
+                evolved_scenarios.append({
+                    "name": "CPU spike",
+                    "details": "Simulate CPU spike as suggested by feedback"
+                })
             
             # Ensure we don't exceed max scenarios
             if len(evolved_scenarios) > self.max_scenarios:
-                logger.warning(f"Evolved scenarios exceed limit, truncating to {self.max_scenarios}")
+                logger.warning("Evolved scenarios exceed limit, truncating to %s", self.max_scenarios)
                 evolved_scenarios = evolved_scenarios[:self.max_scenarios]
             
             # If no scenarios evolved, return originals or defaults
             if not evolved_scenarios:
                 logger.info("No scenarios evolved, returning original scenarios")
-                evolved_scenarios = scenarios if scenarios else self.default_scenarios.copy()
+                evolved_scenarios = scenarios if scenarios else self._copy_defaults()
             
-            logger.info(f"Evolved {len(evolved_scenarios)} chaos scenarios")
+            logger.info("Evolved %s chaos scenarios", len(evolved_scenarios))
             return evolved_scenarios
             
         except Exception as e:
-            logger.error(f"Critical error in scenario evolution: {e}")
-            return scenarios if scenarios else self.default_scenarios.copy()
\ No newline at end of file
+            logger.error("Critical error in scenario evolution: %s", e)
+            return scenarios if scenarios else self._copy_defaults()
\ No newline at end of file
@@ -0,0 +1,9 @@
+import sys
+import os
+
+# Add src to path for imports, once for the whole test session
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Must be set before the test modules import the Flask app, which skips
+# startup work it does not need under TESTING
+os.environ.setdefault('TESTING', '1')
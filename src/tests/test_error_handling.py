@@ -1,14 +1,11 @@
 import unittest
 import json
-import sys
-import os
+import threading
+import time
 from unittest.mock import patch, MagicMock, Mock
 import tempfile
 import logging
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 try:
     from orchestrator.chaos_injector import app
     from models.database import db, ChaosExperiment
@@ -16,12 +13,33 @@ try:
     from monitoring.metrics_collector import MetricsCollector
     from orchestrator.scenario_generator import ScenarioGenerator
     from orchestrator.remediation_agent import RemediationAgent
+    from utils.security import SecurityManager
 except ImportError as e:
     print(f"Import error: {e}")
 
+def _encoded(payloads):
+    """Pair each payload with its JSON body, encoded once at import"""
+    return tuple((payload, json.dumps(payload).encode()) for payload in payloads)
+
 class TestErrorHandling(unittest.TestCase):
     """Comprehensive error handling tests for all core modules"""
 
+    # Request bodies for the /inject tests, encoded once for the whole class
+    MISSING_SCENARIO_PAYLOAD = json.dumps({'duration': 5, 'intensity': 'low'}).encode()
+    CPU_SPIKE_PAYLOAD = json.dumps({'scenario': 'cpu_spike', 'duration': 5, 'intensity': 'low'}).encode()
+    INVALID_DURATION_PAYLOADS = _encoded([
+        {'scenario': 'cpu_spike', 'duration': -1, 'intensity': 'low'},
+        {'scenario': 'cpu_spike', 'duration': 'invalid', 'intensity': 'low'},
+        {'scenario': 'cpu_spike', 'duration': 1000, 'intensity': 'low'},
+        {'scenario': 'cpu_spike', 'duration': None, 'intensity': 'low'}
+    ])
+    INVALID_INTENSITY_PAYLOADS = _encoded([
+        {'scenario': 'cpu_spike', 'duration': 5, 'intensity': 'invalid'},
+        {'scenario': 'cpu_spike', 'duration': 5, 'intensity': 123},
+        {'scenario': 'cpu_spike', 'duration': 5, 'intensity': None},
+        {'scenario': 'cpu_spike', 'duration': 5, 'intensity': ''}
+    ])
+
     def setUp(self):
         """Set up test environment"""
         self.app = app.test_client()
@@ -56,74 +74,49 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_chaos_injector_missing_scenario(self):
         """Test chaos injector handles missing scenario field"""
-        payload = {
-            'duration': 5,
-            'intensity': 'low'
-        }
-        
         response = self.app.post('/inject',
                                 headers=self.headers,
-                                data=json.dumps(payload))
+                                data=self.MISSING_SCENARIO_PAYLOAD)
         
         # Should handle gracefully (401 for auth, 400/422 for validation)
         self.assertIn(response.status_code, [400, 401, 422])
 
     def test_chaos_injector_invalid_duration(self):
         """Test chaos injector handles invalid duration values"""
-        test_cases = [
-            {'scenario': 'cpu_spike', 'duration': -1, 'intensity': 'low'},
-            {'scenario': 'cpu_spike', 'duration': 'invalid', 'intensity': 'low'},
-            {'scenario': 'cpu_spike', 'duration': 1000, 'intensity': 'low'},
-            {'scenario': 'cpu_spike', 'duration': None, 'intensity': 'low'}
-        ]
-        
-        for payload in test_cases:
+        for payload, body in self.INVALID_DURATION_PAYLOADS:
             with self.subTest(payload=payload):
                 response = self.app.post('/inject',
                                         headers=self.headers,
-                                        data=json.dumps(payload))
+                                        data=body)
                 
                 # Should reject invalid values (401 for auth, 400/422 for validation)
                 self.assertIn(response.status_code, [400, 401, 422])
 
     def test_chaos_injector_invalid_intensity(self):
         """Test chaos injector handles invalid intensity values"""
-        test_cases = [
-            {'scenario': 'cpu_spike', 'duration': 5, 'intensity': 'invalid'},
-            {'scenario': 'cpu_spike', 'duration': 5, 'intensity': 123},
-            {'scenario': 'cpu_spike', 'duration': 5, 'intensity': None},
-            {'scenario': 'cpu_spike', 'duration': 5, 'intensity': ''}
-        ]
-        
-        for payload in test_cases:
+        for payload, body in self.INVALID_INTENSITY_PAYLOADS:
             with self.subTest(payload=payload):
                 response = self.app.post('/inject',
                                         headers=self.headers,
-                                        data=json.dumps(payload))
+                                        data=body)
                 
                 # Should reject invalid values (401 for auth, 400/422 for validation)
                 self.assertIn(response.status_code, [400, 401, 422])
 
     def test_chaos_injector_database_error(self):
         """Test chaos injector handles database errors gracefully"""
-        payload = {
-            'scenario': 'cpu_spike',
-            'duration': 5,
-            'intensity': 'low'
-        }
-        
         with patch('models.database.db.session.add') as mock_add:
             mock_add.side_effect = Exception("Database connection failed")
             
             response = self.app.post('/inject',
                                     headers=self.headers,
-                                    data=json.dumps(payload))
+                                    data=self.CPU_SPIKE_PAYLOAD)
             
             # Should handle database error gracefully (401 for auth, 200/500 for execution)
             self.assertIn(response.status_code, [200, 401, 500])
             
             if response.status_code == 200:
-                data = json.loads(response.data)
+                data = response.get_json()
                 # Should still return response, possibly with error indication
 
     def test_nlp_analyzer_invalid_input(self):
@@ -334,9 +327,6 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_concurrent_error_handling(self):
         """Test error handling under concurrent load"""
-        import threading
-        import time
-        
         errors = []
         
         def make_request():
@@ -366,6 +356,46 @@ class TestErrorHandling(unittest.TestCase):
         if errors:
             print(f"Concurrent errors (expected): {len(errors)}")
 
+    def test_rate_limiter_concurrent_access(self):
+        """Test rate limit bookkeeping under concurrent request threads"""
+        manager = SecurityManager(api_key='test', max_tracked_clients=20)
+        errors = []
+        
+        def hammer(worker):
+            try:
+                for i in range(500):
+                    current_time = float(i)
+                    manager._check_rate_limit(f"10.0.{worker}.{i % 40}", current_time, 60)
+                    if i % 25 == 0:
+                        manager._cleanup_rate_limit_storage(current_time + 3600.0)
+            except Exception as e:
+                errors.append(repr(e))
+        
+        threads = [threading.Thread(target=hammer, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # No lost updates or iteration errors, and the client cap still holds
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(manager.rate_limit_storage), 20)
+
+    def test_rate_limiter_sweep_interval(self):
+        """Test that idle clients are swept at most once per interval"""
+        manager = SecurityManager(api_key='test')
+        manager._check_rate_limit('10.0.0.1', 0.0, 60)
+        manager._check_rate_limit('10.0.0.2', 3640.0, 60)
+        manager._cleanup_rate_limit_storage(3599.0)
+        
+        # The first client has now been idle for over an hour, but no sweep is due yet
+        manager._cleanup_rate_limit_storage(3650.0)
+        self.assertIn('10.0.0.1', manager.rate_limit_storage)
+        
+        # Once the interval has passed the sweep drops the idle client only
+        manager._cleanup_rate_limit_storage(3660.0)
+        self.assertEqual(list(manager.rate_limit_storage), ['10.0.0.2'])
+
     def test_memory_pressure_handling(self):
         """Test error handling under memory pressure"""
         analyzer = NLPLogAnalyzer()
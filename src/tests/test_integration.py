@@ -1,206 +1,195 @@
 import unittest
 import json
+import os
+import pytest
 import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from werkzeug.test import EnvironBuilder
 
 try:
-    from orchestrator.chaos_injector import app
+    from orchestrator.chaos_injector import app, security
     from models.database import db, ChaosExperiment
     from ai_models.nlp_log_analysis import NLPLogAnalyzer
 except ImportError as e:
     print(f"Import error: {e}")
 
+# Acceptable status codes for validation tests
+_BAD_STATUS = frozenset({400, 422})
+_OK_OR_BAD = frozenset({200, 400})
+
+# Log analysis fixtures, built once at import; the analyzer only reads them
+_SAMPLE_LOGS = """
+        2025-06-18 10:00:01 INFO Application started
+        2025-06-18 10:00:02 ERROR Database connection failed
+        2025-06-18 10:00:03 CRITICAL Out of memory error
+        2025-06-18 10:00:04 WARNING High CPU usage detected
+        """
+
+_ANALYZED_LOGS_FIXTURE = {
+    'total_lines': 100,
+    'severity_distribution': {'critical': 5, 'high': 10, 'medium': 20},
+    'failure_indicators': {'memory_issues': 3, 'cpu_issues': 2},
+    'affected_services': ['auth-service', 'payment-service']
+}
+
 class TestChaosOrchestrator(unittest.TestCase):
     """Comprehensive integration tests for the chaos orchestrator"""
 
-    def setUp(self):
-        """Set up test client and test database"""
-        self.app = app.test_client()
-        self.app.testing = True
+    # Test API key headers
+    HEADERS = {
+        'X-API-Key': 'test_api_key_2025',
+        'Content-Type': 'application/json'
+    }
+    
+    # Request bodies, encoded once for the whole class
+    CPU_SPIKE_PAYLOAD = json.dumps({'scenario': 'cpu_spike', 'duration': 2, 'intensity': 'low'}).encode()
+    MEMORY_LEAK_PAYLOAD = json.dumps({'scenario': 'memory_leak', 'duration': 2, 'intensity': 'low'}).encode()
+    INJECTION_PAYLOADS = {
+        'cpu_spike': CPU_SPIKE_PAYLOAD,
+        'memory_leak': MEMORY_LEAK_PAYLOAD
+    }
+    INVALID_SCENARIO_PAYLOAD = json.dumps({'scenario': 'invalid_scenario', 'duration': 10, 'intensity': 'medium'}).encode()
+    ZERO_DURATION_PAYLOAD = json.dumps({'scenario': 'cpu_spike', 'duration': 0, 'intensity': 'low'}).encode()
+    INVALID_INTENSITY_PAYLOAD = json.dumps({'scenario': 'cpu_spike', 'duration': 5, 'intensity': 'invalid_intensity'}).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test client shared by every test in the class"""
+        cls.client = app.test_client()
+        cls.client.testing = True
         
-        # Set up test API key
-        self.api_key = "test_api_key_2025"
-        self.headers = {
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        # Worker threads reused by the concurrency tests
+        cls.pool = ThreadPoolExecutor(max_workers=8)
         
         # Mock the security manager for testing
         with patch('orchestrator.chaos_injector.security') as mock_security:
             mock_security.require_api_key = lambda f: f
             mock_security.rate_limit = lambda requests_per_minute: lambda f: f
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown(wait=True)
+
     def test_health_endpoint(self):
         """Test health check endpoint"""
-        response = self.app.get('/health')
+        response = self.client.get('/health')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('status', data)
 
     def test_scenarios_endpoint(self):
         """Test scenarios listing endpoint"""
-        response = self.app.get('/scenarios')
+        response = self.client.get('/scenarios')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('scenarios', data)
         self.assertIsInstance(data['scenarios'], list)
         self.assertGreater(len(data['scenarios']), 10)
 
     def test_metrics_endpoint(self):
         """Test Prometheus metrics endpoint"""
-        response = self.app.get('/metrics')
+        response = self.client.get('/metrics')
         self.assertEqual(response.status_code, 200)
         self.assertIn('system_cpu_percent', response.data.decode())
         self.assertIn('system_memory_percent', response.data.decode())
 
-    def test_cpu_spike_injection(self):
-        """Test CPU spike chaos injection"""
-        payload = {
-            'scenario': 'cpu_spike',
-            'duration': 2,
-            'intensity': 'low'
-        }
-        
-        response = self.app.post('/inject', 
-                                headers=self.headers,
-                                data=json.dumps(payload))
-        
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        self.assertIn('result', data)
-        self.assertEqual(data['scenario'], 'cpu_spike')
-
-    def test_memory_leak_injection(self):
-        """Test memory leak chaos injection"""
-        payload = {
-            'scenario': 'memory_leak',
-            'duration': 2,
-            'intensity': 'low'
-        }
-        
-        response = self.app.post('/inject',
-                                headers=self.headers,
-                                data=json.dumps(payload))
-        
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        self.assertIn('result', data)
-        self.assertEqual(data['scenario'], 'memory_leak')
+    def test_scenario_injection(self):
+        """Test CPU spike and memory leak chaos injection"""
+        for scenario, payload in self.INJECTION_PAYLOADS.items():
+            with self.subTest(scenario=scenario):
+                response = self.client.post('/inject',
+                                            headers=self.HEADERS,
+                                            data=payload)
+                
+                self.assertEqual(response.status_code, 200)
+                data = response.get_json()
+                self.assertIn('result', data)
+                self.assertEqual(data['scenario'], scenario)
 
     def test_invalid_scenario(self):
         """Test handling of invalid chaos scenario"""
-        payload = {
-            'scenario': 'invalid_scenario',
-            'duration': 10,
-            'intensity': 'medium'
-        }
-        
-        response = self.app.post('/inject',
-                                headers=self.headers,
-                                data=json.dumps(payload))
+        response = self.client.post('/inject',
+                                    headers=self.HEADERS,
+                                    data=self.INVALID_SCENARIO_PAYLOAD)
         
         # Should handle gracefully or return error
-        self.assertIn(response.status_code, [200, 400])
+        self.assertIn(response.status_code, _OK_OR_BAD)
 
     def test_duration_validation(self):
         """Test duration parameter validation"""
         # Test too short duration
-        payload = {
-            'scenario': 'cpu_spike',
-            'duration': 0,
-            'intensity': 'low'
-        }
-        
-        response = self.app.post('/inject',
-                                headers=self.headers,
-                                data=json.dumps(payload))
+        response = self.client.post('/inject',
+                                    headers=self.HEADERS,
+                                    data=self.ZERO_DURATION_PAYLOAD)
         
         # Should reject invalid duration
-        self.assertIn(response.status_code, [400, 422])
+        self.assertIn(response.status_code, _BAD_STATUS)
 
     def test_intensity_validation(self):
         """Test intensity parameter validation"""
-        payload = {
-            'scenario': 'cpu_spike',
-            'duration': 5,
-            'intensity': 'invalid_intensity'
-        }
-        
-        response = self.app.post('/inject',
-                                headers=self.headers,
-                                data=json.dumps(payload))
+        response = self.client.post('/inject',
+                                    headers=self.HEADERS,
+                                    data=self.INVALID_INTENSITY_PAYLOAD)
         
         # Should reject invalid intensity
-        self.assertIn(response.status_code, [400, 422])
+        self.assertIn(response.status_code, _BAD_STATUS)
 
     def test_concurrent_chaos_injection(self):
         """Test multiple concurrent chaos injections"""
         def inject_chaos(scenario):
-            payload = {
-                'scenario': scenario,
-                'duration': 2,
-                'intensity': 'low'
-            }
-            return self.app.post('/inject',
-                               headers=self.headers,
-                               data=json.dumps(payload))
+            return self.client.post('/inject',
+                                    headers=self.HEADERS,
+                                    data=self.INJECTION_PAYLOADS[scenario])
         
         # Start multiple chaos scenarios concurrently
-        threads = []
         scenarios = ['cpu_spike', 'memory_leak']
+        futures = [self.pool.submit(inject_chaos, scenario) for scenario in scenarios]
         
-        for scenario in scenarios:
-            thread = threading.Thread(target=inject_chaos, args=(scenario,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all to complete
-        for thread in threads:
-            thread.join()
-        
-        # All should succeed
-        for scenario in scenarios:
-            response = inject_chaos(scenario)
+        # All should succeed, each within a bounded wait
+        for future in futures:
+            response = future.result(timeout=10)
             self.assertEqual(response.status_code, 200)
 
     def test_system_status_endpoint(self):
         """Test system status endpoint"""
-        response = self.app.get('/system-status')
+        response = self.client.get('/system-status')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('system_metrics', data)
         self.assertIn('cpu_percent', data['system_metrics'])
 
     def test_ui_endpoint(self):
         """Test UI serving"""
-        response = self.app.get('/')
+        response = self.client.get('/')
         self.assertEqual(response.status_code, 200)
         
-        response = self.app.get('/ui')
+        response = self.client.get('/ui')
         self.assertEqual(response.status_code, 200)
 
+    def test_ui_conditional_get(self):
+        """Test that a matching ETag, strong or weak, gets 304 Not Modified"""
+        etag = self.client.get('/ui').headers.get('ETag')
+        if etag is None:
+            self.skipTest("index.html is served from disk without an ETag")
+        
+        for tag in (etag, f'W/{etag}'):
+            with self.subTest(if_none_match=tag):
+                response = self.client.get('/ui', headers={'If-None-Match': tag})
+                self.assertEqual(response.status_code, 304)
+
 class TestNLPLogAnalyzer(unittest.TestCase):
     """Test AI/ML log analysis functionality"""
 
-    def setUp(self):
-        self.analyzer = NLPLogAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        # The analyzer keeps no per-call state, so one instance (and one set of
+        # compiled patterns) serves every test
+        cls.analyzer = NLPLogAnalyzer()
 
     def test_analyze_simple_logs(self):
         """Test basic log analysis"""
-        sample_logs = """
-        2025-06-18 10:00:01 INFO Application started
-        2025-06-18 10:00:02 ERROR Database connection failed
-        2025-06-18 10:00:03 CRITICAL Out of memory error
-        2025-06-18 10:00:04 WARNING High CPU usage detected
-        """
-        
-        result = self.analyzer.analyze_logs(sample_logs)
+        result = self.analyzer.analyze_logs(_SAMPLE_LOGS)
         
         self.assertIsInstance(result, dict)
         self.assertIn('total_lines', result)
@@ -214,14 +203,7 @@ class TestNLPLogAnalyzer(unittest.TestCase):
 
     def test_extract_failure_patterns(self):
         """Test failure pattern extraction"""
-        analyzed_logs = {
-            'total_lines': 100,
-            'severity_distribution': {'critical': 5, 'high': 10, 'medium': 20},
-            'failure_indicators': {'memory_issues': 3, 'cpu_issues': 2},
-            'affected_services': ['auth-service', 'payment-service']
-        }
-        
-        patterns = self.analyzer.extract_failure_patterns(analyzed_logs)
+        patterns = self.analyzer.extract_failure_patterns(_ANALYZED_LOGS_FIXTURE)
         
         self.assertIsInstance(patterns, list)
         self.assertGreater(len(patterns), 0)
@@ -259,64 +241,68 @@ class TestNLPLogAnalyzer(unittest.TestCase):
 
     def test_invalid_logs_handling(self):
         """Test handling of invalid log input"""
-        # Test empty logs
-        result = self.analyzer.analyze_logs("")
-        self.assertIn('error', result)
-        
-        # Test None input
-        result = self.analyzer.analyze_logs(None)
-        self.assertIn('error', result)
-        
-        # Test non-string input
-        result = self.analyzer.analyze_logs(123)
-        self.assertIn('error', result)
+        # Empty, None and non-string input
+        for bad in ("", None, 123):
+            with self.subTest(logs=bad):
+                result = self.analyzer.analyze_logs(bad)
+                self.assertIn('error', result)
 
+@pytest.mark.slow
+@unittest.skipIf(os.environ.get('PYTEST_FAST') == '1', 'perf tests skipped')
 class TestPerformance(unittest.TestCase):
     """Performance and load testing"""
 
+    HEADERS = {
+        'X-API-Key': 'test_api_key_2025',
+        'Content-Type': 'application/json'
+    }
+    
+    # Short low-intensity CPU spike, encoded once for the whole class
+    CPU_SPIKE_PAYLOAD = json.dumps({'scenario': 'cpu_spike', 'duration': 1, 'intensity': 'low'}).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = app.test_client()
+
     def setUp(self):
-        self.app = app.test_client()
-        self.headers = {
-            'X-API-Key': 'test_api_key_2025',
-            'Content-Type': 'application/json'
-        }
+        # The app's rate limiter is shared with every other test class; start each
+        # test with an empty window so earlier POSTs can't push these into 429s
+        security.rate_limit_storage.clear()
 
     def test_chaos_injection_performance(self):
         """Test performance of chaos injection under load"""
-        start_time = time.time()
-        
-        # Inject multiple scenarios quickly
-        for i in range(10):
-            payload = {
-                'scenario': 'cpu_spike',
-                'duration': 1,
-                'intensity': 'low'
-            }
+        # Measure request dispatch only: the CPU burn normally runs on a background
+        # thread and would compete with the requests for the GIL
+        with patch('orchestrator.chaos_injector.cpu_stress'):
+            start_time = time.perf_counter()
             
-            response = self.app.post('/inject',
-                                   headers=self.headers,
-                                   data=json.dumps(payload))
+            # Inject multiple scenarios quickly
+            for i in range(10):
+                response = self.client.post('/inject',
+                                            headers=self.HEADERS,
+                                            data=self.CPU_SPIKE_PAYLOAD)
+                
+                # Should respond quickly
+                self.assertEqual(response.status_code, 200)
             
-            # Should respond quickly
-            self.assertEqual(response.status_code, 200)
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+            total_time = time.perf_counter() - start_time
         
-        # Should complete all injections in reasonable time
-        self.assertLess(total_time, 30)  # 30 seconds max for 10 injections
+        # Dispatching 10 injections should take well under a second
+        self.assertLess(total_time, 1.0)
 
     def test_metrics_endpoint_performance(self):
         """Test metrics endpoint performance"""
-        start_time = time.time()
+        # Build the request once; the client only shallow-copies it per call
+        metrics_request = EnvironBuilder(method='GET', path='/metrics').get_request()
+        
+        start_time = time.perf_counter()
         
         # Make multiple requests to metrics endpoint
         for i in range(50):
-            response = self.app.get('/metrics')
+            response = self.client.open(metrics_request)
             self.assertEqual(response.status_code, 200)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = time.perf_counter() - start_time
         
         # Should respond quickly even under load
         self.assertLess(total_time, 10)  # 10 seconds max for 50 requests
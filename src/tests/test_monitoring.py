@@ -1,19 +1,45 @@
 import unittest
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import psutil
 
 from monitoring.metrics_collector import MetricsCollector
 
+# psutil functions the collector reads, patched once per test class
+_PSUTIL_SOURCES = ('cpu_percent', 'virtual_memory', 'disk_usage', 'net_io_counters')
+
 class TestMetricsCollector(unittest.TestCase):
     """Enhanced tests for MetricsCollector with error handling scenarios"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Worker threads reused by the concurrency tests
+        cls.pool = ThreadPoolExecutor(max_workers=8)
+        
+        # One patcher for all psutil sources; each mock calls through to the real
+        # function until a test gives it a side_effect
+        cls.psutil_mocks = {name: MagicMock(wraps=getattr(psutil, name)) for name in _PSUTIL_SOURCES}
+        cls.psutil_patcher = patch.multiple('psutil', **cls.psutil_mocks)
+        cls.psutil_patcher.start()
+        
+        # Canned HTTP responses shared by the Prometheus tests
+        cls.OK_RESPONSE = MagicMock(status_code=200)
+        cls.ERROR_RESPONSE = MagicMock(status_code=500, text="Internal server error")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.psutil_patcher.stop()
+        cls.pool.shutdown(wait=True)
+
     def setUp(self):
         self.collector = MetricsCollector()
+        self._reset_psutil()
+
+    def _reset_psutil(self):
+        """Make every patched psutil source call through to the real function again"""
+        for mock_source in self.psutil_mocks.values():
+            mock_source.side_effect = None
 
     def test_collect_metrics_success(self):
         """Test successful metrics collection"""
@@ -26,48 +52,33 @@ class TestMetricsCollector(unittest.TestCase):
 
     def test_collect_metrics_with_psutil_errors(self):
         """Test metrics collection with psutil errors"""
-        with patch('psutil.cpu_percent') as mock_cpu:
-            mock_cpu.side_effect = Exception("Access denied")
-            
-            metrics = self.collector.collect_metrics()
-            
-            # Should still return metrics dict with error information
-            self.assertIsInstance(metrics, dict)
-            self.assertIn('cpu', metrics)
-            self.assertIn('error', metrics['cpu'])
-
-    def test_collect_metrics_memory_error(self):
-        """Test metrics collection with memory access errors"""
-        with patch('psutil.virtual_memory') as mock_memory:
-            mock_memory.side_effect = PermissionError("Memory access denied")
-            
-            metrics = self.collector.collect_metrics()
-            
-            # Should handle gracefully
-            self.assertIsInstance(metrics, dict)
-            self.assertIn('memory', metrics)
-
-    def test_collect_metrics_disk_error(self):
-        """Test metrics collection with disk access errors"""
-        with patch('psutil.disk_usage') as mock_disk:
-            mock_disk.side_effect = FileNotFoundError("Disk not found")
-            
-            metrics = self.collector.collect_metrics()
-            
-            # Should handle gracefully
-            self.assertIsInstance(metrics, dict)
-            self.assertIn('disk', metrics)
-
-    def test_collect_metrics_network_error(self):
-        """Test metrics collection with network access errors"""
-        with patch('psutil.net_io_counters') as mock_net:
-            mock_net.side_effect = Exception("Network interface error")
-            
-            metrics = self.collector.collect_metrics()
-            
-            # Should handle gracefully
-            self.assertIsInstance(metrics, dict)
-            self.assertIn('network', metrics)
+        self.psutil_mocks['cpu_percent'].side_effect = Exception("Access denied")
+        
+        metrics = self.collector.collect_metrics()
+        
+        # Should still return metrics dict with error information
+        self.assertIsInstance(metrics, dict)
+        self.assertIn('cpu', metrics)
+        self.assertIn('error', metrics['cpu'])
+
+    def test_collect_metrics_section_errors(self):
+        """Test metrics collection when individual psutil sources fail"""
+        failing_sources = [
+            ('virtual_memory', PermissionError("Memory access denied"), 'memory'),
+            ('disk_usage', FileNotFoundError("Disk not found"), 'disk'),
+            ('net_io_counters', Exception("Network interface error"), 'network'),
+        ]
+        
+        for attr, error, section in failing_sources:
+            with self.subTest(source=attr):
+                self._reset_psutil()
+                self.psutil_mocks[attr].side_effect = error
+                
+                metrics = self.collector.collect_metrics()
+                
+                # Should handle gracefully
+                self.assertIsInstance(metrics, dict)
+                self.assertIn(section, metrics)
 
     def test_send_to_prometheus_success(self):
         """Test successful Prometheus sending"""
@@ -75,9 +86,7 @@ class TestMetricsCollector(unittest.TestCase):
         
         # Mock successful network response
         with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_post.return_value = mock_response
+            mock_post.return_value = self.OK_RESPONSE
             
             result = self.collector.send_to_prometheus(metrics)
             
@@ -117,10 +126,7 @@ class TestMetricsCollector(unittest.TestCase):
         metrics = {'cpu': {'usage_percent': 50}}
         
         with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal server error"
-            mock_post.return_value = mock_response
+            mock_post.return_value = self.ERROR_RESPONSE
             
             result = self.collector.send_to_prometheus(metrics)
             
@@ -161,48 +167,30 @@ class TestMetricsCollector(unittest.TestCase):
 
     def test_concurrent_collection(self):
         """Test concurrent metrics collection"""
-        import threading
+        futures = [self.pool.submit(self.collector.collect_metrics) for _ in range(5)]
         
-        results = []
-        errors = []
-        
-        def collect_metrics():
-            try:
-                metrics = self.collector.collect_metrics()
-                results.append(metrics)
-            except Exception as e:
-                errors.append(str(e))
-        
-        # Start multiple collection threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=collect_metrics)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Bounded wait; any exception raised in a worker is re-raised here
+        results = [future.result(timeout=10) for future in futures]
         
         # Should handle concurrent access gracefully
         self.assertEqual(len(results), 5)
-        self.assertEqual(len(errors), 0)
+        for metrics in results:
+            self.assertIsInstance(metrics, dict)
 
     def test_collection_error_threshold(self):
         """Test collection error threshold handling"""
         # Force multiple collection errors
-        with patch('psutil.cpu_percent') as mock_cpu:
-            mock_cpu.side_effect = Exception("Persistent error")
-            
-            # Collect multiple times to trigger error threshold
-            for i in range(10):
-                metrics = self.collector.collect_metrics()
-                
-                # Should always return some form of metrics
-                self.assertIsInstance(metrics, dict)
+        self.psutil_mocks['cpu_percent'].side_effect = Exception("Persistent error")
+        
+        # Collect multiple times to trigger error threshold
+        for i in range(10):
+            metrics = self.collector.collect_metrics()
             
-            # Check if error count is tracked
-            self.assertGreater(self.collector.collection_errors, 0)
+            # Should always return some form of metrics
+            self.assertIsInstance(metrics, dict)
+        
+        # Check if error count is tracked
+        self.assertGreater(self.collector.collection_errors, 0)
 
     def test_health_status(self):
         """Test health status reporting"""
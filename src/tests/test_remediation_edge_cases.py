@@ -0,0 +1,110 @@
+import unittest
+
+from orchestrator.remediation_agent import RemediationAgent
+
+class TestRemediationEdgeCases(unittest.TestCase):
+    """Edge case tests for the RemediationAgent assessment helpers"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.agent = RemediationAgent()
+
+    def setUp(self):
+        # Return the shared agent to its freshly-constructed state
+        self.agent.current_state = "unknown"
+        self.agent.remediation_history.clear()
+
+    def test_severity_calculation_edge_cases(self):
+        """Test severity calculation with edge cases"""
+        test_cases = [
+            ("unknown_event", "invalid_intensity", -1),
+            ("cpu_spike", "", 0),
+            ("memory_leak", "critical", 10000),  # Very long duration
+            (None, None, None),
+        ]
+        
+        for event_type, intensity, duration in test_cases:
+            with self.subTest(event_type=event_type, intensity=intensity, duration=duration):
+                try:
+                    severity = self.agent._calculate_severity(event_type or "", intensity or "", duration or 0)
+                    self.assertIn(severity, ["low", "medium", "high", "critical"])
+                except Exception:
+                    # Should not raise exceptions
+                    self.fail("_calculate_severity raised an exception")
+
+    def test_severity_duration_boundaries(self):
+        """Test severity per intensity on each side of the 300s / 600s duration thresholds"""
+        # Durations strictly over 300s and 600s move to the next bucket; a non-numeric
+        # duration scores as 0s. Unknown intensities use the medium row.
+        durations = (300, 301, 600, 601, "long")
+        expected = {
+            "low":      ("low", "low", "low", "medium", "low"),
+            "medium":   ("medium", "high", "high", "critical", "medium"),
+            "high":     ("high", "critical", "critical", "critical", "high"),
+            "critical": ("critical", "critical", "critical", "critical", "critical"),
+            "unknown":  ("medium", "high", "high", "critical", "medium"),
+        }
+
+        for intensity, severities in expected.items():
+            for duration, severity in zip(durations, severities):
+                with self.subTest(intensity=intensity, duration=duration):
+                    self.assertEqual(self.agent._calculate_severity("cpu_spike", intensity, duration), severity)
+
+    def test_service_identification_edge_cases(self):
+        """Test service identification with edge cases"""
+        test_cases = [
+            ("unknown_event", {}),
+            ("cpu_spike", {"affected_services": "not_a_list"}),
+            ("memory_leak", {"affected_services": list(range(20))}),  # Too many services
+            (None, None),
+        ]
+        
+        for event_type, event_data in test_cases:
+            with self.subTest(event_type=event_type, event_data=event_data):
+                try:
+                    services = self.agent._identify_affected_services(event_type or "", event_data or {})
+                    self.assertIsInstance(services, list)
+                    self.assertLessEqual(len(services), 10)  # Should limit services
+                except Exception:
+                    # Should not raise exceptions
+                    self.fail("_identify_affected_services raised an exception")
+
+    def test_confidence_calculation_edge_cases(self):
+        """Test confidence calculation with edge cases"""
+        test_cases = [
+            ("unknown_event", {}),
+            ("cpu_spike", {"invalid": "data"}),
+            (None, None),
+        ]
+        
+        for event_type, event_data in test_cases:
+            with self.subTest(event_type=event_type, event_data=event_data):
+                try:
+                    confidence = self.agent._calculate_confidence(event_type or "", event_data or {})
+                    self.assertIsInstance(confidence, float)
+                    self.assertGreaterEqual(confidence, 0.0)
+                    self.assertLessEqual(confidence, 1.0)
+                except Exception:
+                    # Should not raise exceptions
+                    self.fail("_calculate_confidence raised an exception")
+
+    def test_recommendations_generation_edge_cases(self):
+        """Test recommendations generation with edge cases"""
+        test_cases = [
+            ("unknown_event", "unknown_severity"),
+            (None, None),
+            ("", ""),
+        ]
+        
+        for event_type, severity in test_cases:
+            with self.subTest(event_type=event_type, severity=severity):
+                try:
+                    recommendations = self.agent._generate_recommendations(event_type or "", severity or "")
+                    self.assertIsInstance(recommendations, list)
+                    self.assertGreater(len(recommendations), 0)
+                except Exception:
+                    # Should not raise exceptions
+                    self.fail("_generate_recommendations raised an exception")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+import threading
+
+from orchestrator.remediation_agent import RemediationAgent, RemediationRecord
+
+class TestRemediationExecution(unittest.TestCase):
+    """Tests for RemediationAgent execution, history and state tracking"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.agent = RemediationAgent()
+
+    def setUp(self):
+        # Return the shared agent to its freshly-constructed state
+        self.agent.current_state = "unknown"
+        self.agent.remediation_history.clear()
+
+    def test_execute_remediation_success(self):
+        """Test successful remediation execution"""
+        assessment = {"strategy": "remediate_network_failure", "severity": "high"}
+        result = self.agent.execute_remediation(assessment)
+        
+        self.assertIsInstance(result, bool)
+        if result:
+            self.assertEqual(self.agent.current_state, "healthy")
+
+    def test_execute_remediation_string_input(self):
+        """Test remediation execution with string input"""
+        result = self.agent.execute_remediation("remediate_network_failure")
+        
+        self.assertIsInstance(result, bool)
+
+    def test_execute_remediation_none_input(self):
+        """Test remediation execution with None input"""
+        result = self.agent.execute_remediation(None)
+        
+        self.assertIsInstance(result, bool)
+        self.assertFalse(result)  # Should fail gracefully
+
+    def test_execute_remediation_invalid_types(self):
+        """Test remediation execution with invalid input types"""
+        invalid_inputs = [123, [], set(), lambda: None]
+        
+        for invalid_input in invalid_inputs:
+            with self.subTest(input=invalid_input):
+                result = self.agent.execute_remediation(invalid_input)
+                
+                self.assertIsInstance(result, bool)
+                self.assertFalse(result)  # Should fail gracefully
+
+    def test_execute_remediation_various_strategies(self):
+        """Test remediation execution with various strategies"""
+        strategies = [
+            {"strategy": "remediate_cpu_spike", "event_type": "cpu_spike"},
+            {"strategy": "remediate_memory_leak", "event_type": "memory_leak"},
+            {"strategy": "remediate_disk_full", "event_type": "disk_full"},
+            {"strategy": "unknown_strategy", "event_type": "unknown"},
+        ]
+        
+        for assessment in strategies:
+            with self.subTest(assessment=assessment):
+                result = self.agent.execute_remediation(assessment)
+                
+                self.assertIsInstance(result, bool)
+
+    def test_handle_event(self):
+        """Test fused assessment and remediation"""
+        assessment, success = self.agent.handle_event({"event": "cpu_spike", "intensity": "high"})
+
+        self.assertTrue(success)
+        self.assertEqual(assessment["event_type"], "cpu_spike")
+        self.assertIn("severity", assessment)
+        self.assertEqual(self.agent.current_state, "healthy")
+
+        assessment, success = self.agent.handle_event(None)
+        self.assertFalse(success)
+        self.assertIn("error", assessment)
+
+    def test_remediation_history_tracking(self):
+        """Test that remediation history is properly tracked"""
+        initial_history_count = len(self.agent.remediation_history)
+        
+        # Execute some remediations
+        assessments = [
+            {"strategy": "remediate_network_failure"},
+            {"strategy": "remediate_cpu_spike"},
+        ]
+        
+        for assessment in assessments:
+            self.agent.execute_remediation(assessment)
+        
+        # History should have grown
+        self.assertGreater(len(self.agent.remediation_history), initial_history_count)
+
+    def test_remediation_history_limit(self):
+        """Test that remediation history respects size limit"""
+        # Fill history beyond limit in one bulk extend
+        overflow = self.agent.max_history + 10
+        self.agent.remediation_history.extend(
+            RemediationRecord("", f"strategy_{i}", "test", True, 0.1) for i in range(overflow)
+        )
+        
+        # Should not exceed max_history, keeping the newest entries
+        self.assertLessEqual(len(self.agent.remediation_history), self.agent.max_history)
+        self.assertEqual(self.agent.remediation_history[-1].strategy, f"strategy_{overflow - 1}")
+
+    def test_get_remediation_status(self):
+        """Test remediation status reporting"""
+        status = self.agent.get_remediation_status()
+        
+        self.assertIsInstance(status, dict)
+        self.assertIn('current_state', status)
+        self.assertIn('history_count', status)
+        self.assertIn('supported_events', status)
+
+    def test_remediation_state_transitions(self):
+        """Test state transitions during remediation"""
+        # Initial state
+        initial_state = self.agent.current_state
+        
+        # Successful remediation
+        result = self.agent.execute_remediation({"strategy": "remediate_network_failure"})
+        if result:
+            self.assertEqual(self.agent.current_state, "healthy")
+
+    def test_concurrent_remediation(self):
+        """Test concurrent remediation attempts"""
+        results = []
+        errors = []
+        # Release all workers at once so the remediations actually overlap
+        barrier = threading.Barrier(5)
+        
+        def execute_remediation():
+            try:
+                barrier.wait(timeout=5)
+                result = self.agent.execute_remediation({"strategy": "remediate_cpu_spike"})
+                results.append(result)
+            except Exception as e:
+                errors.append(str(e))
+        
+        # Start multiple remediation threads
+        threads = [threading.Thread(target=execute_remediation) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        
+        # Wait for completion
+        for thread in threads:
+            thread.join()
+        
+        # Should handle concurrent access gracefully
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(errors), 0)
+
+if __name__ == '__main__':
+    unittest.main()
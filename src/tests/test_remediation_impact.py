@@ -0,0 +1,91 @@
+import unittest
+
+from orchestrator.remediation_agent import RemediationAgent
+
+# Read-only event fixture; assess_impact does not mutate its input
+_NET_FAIL_EVENT = {"event": "network_failure", "intensity": "high", "duration": 60}
+
+class TestRemediationImpact(unittest.TestCase):
+    """Tests for RemediationAgent impact assessment"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.agent = RemediationAgent()
+
+    def setUp(self):
+        # Return the shared agent to its freshly-constructed state
+        self.agent.current_state = "unknown"
+        self.agent.remediation_history.clear()
+
+    def test_assess_impact_success(self):
+        """Test successful impact assessment"""
+        impact = self.agent.assess_impact(_NET_FAIL_EVENT)
+        
+        self.assertIsNotNone(impact)
+        self.assertIsInstance(impact, dict)
+        self.assertIn("severity", impact)
+        self.assertIn("affected_services", impact)
+        self.assertIn("confidence", impact)
+
+    def test_assess_impact_string_input(self):
+        """Test impact assessment with string input"""
+        impact = self.agent.assess_impact("network_failure")
+        
+        self.assertIsInstance(impact, dict)
+        self.assertIn("severity", impact)
+        self.assertIn("affected_services", impact)
+
+    def test_assess_impact_none_input(self):
+        """Test impact assessment with None input"""
+        impact = self.agent.assess_impact(None)
+        
+        self.assertIsInstance(impact, dict)
+        self.assertIn("severity", impact)
+        self.assertIn("error", impact)
+
+    def test_assess_impact_invalid_types(self):
+        """Test impact assessment with invalid input types"""
+        invalid_inputs = [123, [], set(), lambda: None]
+        
+        for invalid_input in invalid_inputs:
+            with self.subTest(input=invalid_input):
+                impact = self.agent.assess_impact(invalid_input)
+                
+                self.assertIsInstance(impact, dict)
+                self.assertIn("severity", impact)
+                self.assertIn("error", impact)
+
+    def test_assess_impact_malformed_dict(self):
+        """Test impact assessment with malformed dictionary"""
+        malformed_events = [
+            {},  # Empty dict
+            {"invalid": "data"},  # Missing expected fields
+            {"event": None},  # None event type
+            {"event": "", "intensity": None},  # Empty/None values
+        ]
+        
+        for event in malformed_events:
+            with self.subTest(event=event):
+                impact = self.agent.assess_impact(event)
+                
+                self.assertIsInstance(impact, dict)
+                self.assertIn("severity", impact)
+
+    def test_assess_impact_various_severities(self):
+        """Test impact assessment with different severity levels"""
+        test_cases = [
+            {"event": "cpu_spike", "intensity": "low", "duration": 10},
+            {"event": "memory_leak", "intensity": "high", "duration": 300},
+            {"event": "network_partition", "intensity": "critical", "duration": 600},
+        ]
+        
+        for event in test_cases:
+            with self.subTest(event=event):
+                impact = self.agent.assess_impact(event)
+                
+                self.assertIsInstance(impact, dict)
+                self.assertIn("severity", impact)
+                self.assertIn(impact["severity"], ["low", "medium", "high", "critical"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,14 @@
 import unittest
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from orchestrator.scenario_generator import ScenarioGenerator
 
 class TestScenarioGenerator(unittest.TestCase):
     """Enhanced tests for ScenarioGenerator with error handling scenarios"""
 
-    def setUp(self):
-        self.scenario_generator = ScenarioGenerator()
+    @classmethod
+    def setUpClass(cls):
+        # The generator only reads its configuration, so one instance serves every test
+        cls.scenario_generator = ScenarioGenerator()
 
     def test_generate_scenarios_success(self):
         """Test successful scenario generation"""
@@ -101,6 +98,28 @@ class TestScenarioGenerator(unittest.TestCase):
                 self.assertIsInstance(scenarios, list)
                 self.assertGreater(len(scenarios), 0)
 
+    def test_generate_scenarios_results_are_independent(self):
+        """Test that editing one result does not leak into later calls"""
+        past_failures = ["CPU overload", "unclassified failure"]
+        metrics = {"cpu": 95}
+
+        first = self.scenario_generator.generate_scenarios(past_failures, metrics)
+        expected = [dict(scenario) for scenario in first]
+        for scenario in first:
+            scenario["details"] = "edited by caller"
+
+        second = self.scenario_generator.generate_scenarios(past_failures, metrics)
+        self.assertEqual(second, expected)
+
+    def test_default_scenarios_are_copied(self):
+        """Test that editing a default fallback does not change the next one"""
+        first = self.scenario_generator.generate_scenarios([], {})
+        expected = [dict(scenario) for scenario in first]
+        first[0]["details"] = "edited by caller"
+
+        self.assertEqual(self.scenario_generator.generate_scenarios([], {}), expected)
+        self.assertEqual(self.scenario_generator.evolve_scenarios(), expected)
+
     def test_evolve_scenarios_success(self):
         """Test successful scenario evolution"""
         past_failures = ["failure1"]
@@ -219,8 +238,12 @@ class TestScenarioGenerator(unittest.TestCase):
         self.assertGreater(self.scenario_generator.max_scenarios, 0)
         
         # Test default_scenarios
-        self.assertIsInstance(self.scenario_generator.default_scenarios, list)
+        self.assertIsInstance(self.scenario_generator.default_scenarios, (list, tuple))
         self.assertGreater(len(self.scenario_generator.default_scenarios), 0)
+        
+        # Shared defaults are read-only
+        with self.assertRaises(TypeError):
+            self.scenario_generator.default_scenarios[0]["details"] = "edited"
 
     def test_scenario_content_validation(self):
         """Test that generated scenarios have valid content"""
@@ -4,7 +4,9 @@ from functools import wraps
 from flask import request, jsonify
 import hashlib
 import hmac
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict, deque
 
 # Configure logging
 logging.basicConfig(
@@ -13,10 +15,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds between full sweeps for idle clients; each request only trims its own client
+RATE_LIMIT_SWEEP_INTERVAL = 60.0
+
 class SecurityManager:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, max_tracked_clients=10000):
         self.api_key = api_key or os.getenv('CHAOS_API_KEY', 'default_dev_key')
-        self.rate_limit_storage = {}
+        self._api_key_digest = hashlib.sha256(self.api_key.encode('utf-8')).digest()
+        # Least recently seen clients first, so the table can be capped like an LRU
+        self.rate_limit_storage = OrderedDict()
+        self.max_tracked_clients = max_tracked_clients
+        # Guards rate_limit_storage against concurrent request threads
+        self._rate_limit_lock = threading.Lock()
+        self._next_rate_limit_sweep = 0.0
         
     def require_api_key(self, f):
         """Decorator to require API key authentication"""
@@ -41,9 +52,9 @@ class SecurityManager:
             @wraps(f)
             def decorated(*args, **kwargs):
                 client_ip = request.remote_addr
-                current_time = datetime.now()
+                current_time = time.monotonic()
                 
-                # Clean old entries
+                # Drop idle clients, at most once per RATE_LIMIT_SWEEP_INTERVAL
                 self._cleanup_rate_limit_storage(current_time)
                 
                 # Check rate limit
@@ -56,39 +67,57 @@ class SecurityManager:
         return decorator
     
     def _verify_api_key(self, provided_key):
-        """Verify API key using secure comparison"""
-        return hmac.compare_digest(self.api_key, provided_key)
+        """Verify API key using secure comparison of fixed-length SHA-256 digests"""
+        provided_digest = hashlib.sha256(provided_key.encode('utf-8')).digest()
+        return hmac.compare_digest(self._api_key_digest, provided_digest)
     
     def _check_rate_limit(self, client_ip, current_time, requests_per_minute):
         """Check if client has exceeded rate limit"""
-        if client_ip not in self.rate_limit_storage:
-            self.rate_limit_storage[client_ip] = []
-        
-        # Add current request
-        self.rate_limit_storage[client_ip].append(current_time)
-        
-        # Count requests in last minute
-        minute_ago = current_time - timedelta(minutes=1)
-        recent_requests = [
-            req_time for req_time in self.rate_limit_storage[client_ip]
-            if req_time > minute_ago
-        ]
-        
-        self.rate_limit_storage[client_ip] = recent_requests
-        return len(recent_requests) <= requests_per_minute
+        with self._rate_limit_lock:
+            recent_requests = self.rate_limit_storage.get(client_ip)
+            if recent_requests is None:
+                recent_requests = self.rate_limit_storage[client_ip] = deque()
+                # Forget the least recently seen client once the table is full
+                if len(self.rate_limit_storage) > self.max_tracked_clients:
+                    self.rate_limit_storage.popitem(last=False)
+            else:
+                self.rate_limit_storage.move_to_end(client_ip)
+            
+            # Timestamps are appended in order, so expired ones are always at the left
+            minute_ago = current_time - 60.0
+            while recent_requests and recent_requests[0] <= minute_ago:
+                recent_requests.popleft()
+            
+            # Add current request
+            recent_requests.append(current_time)
+            return len(recent_requests) <= requests_per_minute
     
     def _cleanup_rate_limit_storage(self, current_time):
-        """Clean up old rate limit entries"""
-        hour_ago = current_time - timedelta(hours=1)
-        for client_ip in list(self.rate_limit_storage.keys()):
-            self.rate_limit_storage[client_ip] = [
-                req_time for req_time in self.rate_limit_storage[client_ip]
-                if req_time > hour_ago
-            ]
-            if not self.rate_limit_storage[client_ip]:
-                del self.rate_limit_storage[client_ip]
+        """Clean up old rate limit entries if a sweep is due"""
+        hour_ago = current_time - 3600.0
+        with self._rate_limit_lock:
+            if current_time < self._next_rate_limit_sweep:
+                return
+            self._next_rate_limit_sweep = current_time + RATE_LIMIT_SWEEP_INTERVAL
+            
+            for client_ip, request_times in list(self.rate_limit_storage.items()):
+                while request_times and request_times[0] <= hour_ago:
+                    request_times.popleft()
+                if not request_times:
+                    del self.rate_limit_storage[client_ip]
 
 # Input validation utilities
+_SCENARIO_NAMES = (
+    'cpu_spike', 'memory_leak', 'disk_fill', 'network_latency',
+    'network_partition', 'process_kill', 'container_restart',
+    'database_slowdown', 'api_timeout', 'ssl_certificate_expired',
+    'dns_failure', 'storage_corruption', 'kubernetes_pod_eviction',
+    'service_discovery_failure', 'load_balancer_failure'
+)
+_VALID_SCENARIOS = frozenset(_SCENARIO_NAMES)
+_INVALID_SCENARIO_MSG = f"Invalid scenario. Must be one of: {', '.join(_SCENARIO_NAMES)}"
+_VALID_INTENSITY = frozenset({'low', 'medium', 'high'})
+
 def validate_chaos_input(data):
     """Validate chaos injection input"""
     if not isinstance(data, dict):
@@ -99,16 +128,8 @@ def validate_chaos_input(data):
     intensity = data.get('intensity', '')
     
     # Validate scenario
-    valid_scenarios = [
-        'cpu_spike', 'memory_leak', 'disk_fill', 'network_latency',
-        'network_partition', 'process_kill', 'container_restart',
-        'database_slowdown', 'api_timeout', 'ssl_certificate_expired',
-        'dns_failure', 'storage_corruption', 'kubernetes_pod_eviction',
-        'service_discovery_failure', 'load_balancer_failure'
-    ]
-    
-    if scenario not in valid_scenarios:
-        return False, f"Invalid scenario. Must be one of: {', '.join(valid_scenarios)}"
+    if not isinstance(scenario, str) or scenario not in _VALID_SCENARIOS:
+        return False, _INVALID_SCENARIO_MSG
     
     # Validate duration
     try:
@@ -119,14 +140,16 @@ def validate_chaos_input(data):
         return False, "Duration must be a valid integer"
     
     # Validate intensity
-    if intensity not in ['low', 'medium', 'high']:
+    if not isinstance(intensity, str) or intensity not in _VALID_INTENSITY:
         return False, "Intensity must be 'low', 'medium', or 'high'"
     
     return True, "Valid input"
 
+# Escapes for potential log injection characters, applied in a single pass
+_LOG_SANITIZE_TABLE = str.maketrans({'\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
 def sanitize_log_data(data):
     """Sanitize data for logging to prevent log injection"""
     if isinstance(data, str):
-        # Remove or escape potential log injection characters
-        return data.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+        return data.translate(_LOG_SANITIZE_TABLE)
     return str(data)